@@ -1,4 +1,11 @@
-from .llm import create_llm, create_llm_with_tools
-from .prompts import (ITINERARY_PROMPT_TEMPLATE, OPTIMISER_SYSTEM_PROMPT,
-                      PLANNER_SYSTEM_PROMPT, REVIEWER_CONFIRMED_PROMPT,
-                      REVIEWER_INITIAL_PROMPT, REVIEWER_RESPONSE_PROMPT)
+from .llm import (build_system_block, create_llm, create_llm_with_tools,
+                  get_shared_llm, log_cache_usage, trim_history,
+                  with_history_breakpoint)
+from .prompts import (ITINERARY_SYSTEM_PROMPT, OPTIMISER_FEEDBACK_BLOCKS,
+                      OPTIMISER_INITIAL_BLOCKS, OPTIMISER_MODE_FEEDBACK,
+                      OPTIMISER_MODE_INITIAL, OPTIMISER_SYSTEM_PROMPT,
+                      PLANNER_SYSTEM_BLOCKS, PLANNER_SYSTEM_PROMPT,
+                      REVIEWER_INITIAL_BLOCKS, REVIEWER_INITIAL_PROMPT,
+                      REVIEWER_RESPONSE_BLOCKS, REVIEWER_RESPONSE_PROMPT,
+                      format_confirmation_message, format_itinerary_route_data,
+                      format_segments_table)
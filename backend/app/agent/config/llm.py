@@ -1,16 +1,34 @@
 import logging
-from typing import List
+from collections import OrderedDict
+from functools import cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from langchain_anthropic import ChatAnthropic
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.messages.utils import (count_tokens_approximately,
+                                           trim_messages)
 
 DEFAULT_MODEL = "claude-sonnet-4-5-20250929"
 DEFAULT_TEMPERATURE = 0.3
 DEFAULT_MAX_TOKENS = 8192
 DEFAULT_MAX_RETRIES = 2
+LLM_CACHE_SIZE = 16
+
+# Approximate token budget for the conversation history sent with each call
+MAX_HISTORY_TOKENS = 16000
+
+# Characters per token assumed by count_tokens_approximately
+CHARS_PER_TOKEN = 4
+
+# Anthropic prompt cache breakpoint marker
+EPHEMERAL_CACHE = {"type": "ephemeral"}
 
 logger = logging.getLogger(__name__)
 
+# Tool-bound LLMs keyed by (model, temperature, tool names), least recently used first
+_llm_cache: "OrderedDict[Tuple, BaseChatModel]" = OrderedDict()
+
 
 def create_llm(
     model_name: str = DEFAULT_MODEL,
@@ -29,7 +47,7 @@ def create_llm(
     Returns:
         Configured ChatAnthropic instance
     """
-    logger.info(f"Initializing LLM with model: {model_name}")
+    logger.info("Initializing LLM with model: %s", model_name)
 
     return ChatAnthropic(
         model_name=model_name,
@@ -41,6 +59,30 @@ def create_llm(
     )
 
 
+def get_shared_llm(
+    model_name: str = DEFAULT_MODEL, temperature: float = DEFAULT_TEMPERATURE
+) -> BaseChatModel:
+    """Return the process-wide LLM client for a model and temperature.
+
+    Tool bindings wrap this instance rather than creating their own, so every
+    node shares one Anthropic client and its connection pool.
+
+    Args:
+        model_name: The Claude model to use
+        temperature: Sampling temperature (0-1)
+
+    Returns:
+        Shared ChatAnthropic instance
+    """
+    # Normalise to positional arguments so default and explicit calls share a key
+    return _shared_llm(model_name, temperature)
+
+
+@cache
+def _shared_llm(model_name: str, temperature: float) -> BaseChatModel:
+    return create_llm(model_name=model_name, temperature=temperature)
+
+
 def create_llm_with_tools(
     tools: List,
     model_name: str = DEFAULT_MODEL,
@@ -48,6 +90,10 @@ def create_llm_with_tools(
 ) -> BaseChatModel:
     """Create an LLM instance bound with specific tools.
 
+    Bound instances are cached per model, temperature and tool set, so
+    nodes sharing a configuration reuse one tool schema. All bindings wrap
+    the same shared client from get_shared_llm.
+
     Args:
         tools: List of tools/schemas to bind to the LLM
         model_name: The Claude model to use
@@ -56,10 +102,154 @@ def create_llm_with_tools(
     Returns:
         LLM instance with tools bound
     """
-    llm = create_llm(
-        model_name=model_name,
-        temperature=temperature,
+    key = (model_name, temperature, _tool_fingerprint(tools))
+
+    cached = _llm_cache.get(key)
+    if cached is not None:
+        _llm_cache.move_to_end(key)
+        return cached
+
+    llm = get_shared_llm(model_name, temperature)
+
+    logger.info("Binding %d tools to LLM", len(tools))
+    bound = llm.bind_tools(tools)  # type: ignore
+
+    _llm_cache[key] = bound
+    if len(_llm_cache) > LLM_CACHE_SIZE:
+        _llm_cache.popitem(last=False)
+
+    return bound
+
+
+def _tool_fingerprint(tools: List) -> Tuple[str, ...]:
+    """Identify a tool set by the names the LLM sees, in binding order."""
+    return tuple(getattr(tool, "name", None) or tool.__name__ for tool in tools)
+
+
+def build_system_block(
+    prompt: str, context: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Wrap a static system prompt as a cacheable Anthropic content block.
+
+    Marking the block with cache_control lets Anthropic serve the system
+    prefix, which is identical across turns, from its prompt cache instead
+    of re-processing it on every call. Per-call data goes in a trailing
+    context block so it does not break the cached prefix.
+
+    Args:
+        prompt: The static system prompt text
+        context: Optional dynamic text appended after the cached prompt
+
+    Returns:
+        List of system content blocks to pass as the system argument
+    """
+    blocks: List[Dict[str, Any]] = [
+        {"type": "text", "text": prompt, "cache_control": EPHEMERAL_CACHE}
+    ]
+    if context:
+        blocks.append({"type": "text", "text": context})
+    return blocks
+
+
+def trim_history(messages: Sequence[BaseMessage]) -> List[BaseMessage]:
+    """Keep only the most recent conversation turns within MAX_HISTORY_TOKENS.
+
+    Tokens are estimated locally rather than counted by the API. The kept
+    window always starts on a human message so tool calls are never separated
+    from their results. Short histories are returned whole, which keeps the
+    cached prefix stable until the budget is reached.
+
+    Args:
+        messages: Full conversation history
+
+    Returns:
+        The trailing messages that fit the budget. If even the latest turn
+        does not fit, that turn alone, with an oversized human message cut
+        down to the budget
+    """
+    trimmed = trim_messages(
+        messages,
+        max_tokens=MAX_HISTORY_TOKENS,
+        strategy="last",
+        token_counter=count_tokens_approximately,
+        start_on="human",
+    )
+    if trimmed or not messages:
+        return trimmed
+
+    # No whole turn fits, so fall back to the latest turn on its own
+    start = next(
+        (i for i in range(len(messages) - 1, -1, -1) if messages[i].type == "human"),
+        0,
     )
+    latest_turn = list(messages[start:])
+
+    human = latest_turn[0]
+    max_chars = MAX_HISTORY_TOKENS * CHARS_PER_TOKEN
+    if (
+        human.type == "human"
+        and isinstance(human.content, str)
+        and len(human.content) > max_chars
+    ):
+        latest_turn[0] = human.model_copy(update={"content": human.content[:max_chars]})
+
+    tokens = count_tokens_approximately(latest_turn)
+    logger.warning(
+        "History exceeds the %d token budget; sending the latest turn only "
+        "(~%d tokens)",
+        MAX_HISTORY_TOKENS,
+        tokens,
+    )
+    return latest_turn
+
 
-    logger.info(f"Binding {len(tools)} tools to LLM")
-    return llm.bind_tools(tools)  # type: ignore
+def with_history_breakpoint(messages: Sequence[BaseMessage]) -> List[BaseMessage]:
+    """Mark the end of the conversation history as a prompt cache breakpoint.
+
+    The system block only caches tools and system prompt. Adding a breakpoint
+    on the last history message lets the next call in a tool loop read the
+    whole conversation so far from the cache and only process the new turns.
+    The original message is left untouched; a copy carries the marker.
+
+    Args:
+        messages: Conversation history about to be sent to the LLM
+
+    Returns:
+        New list with the last message's final content block marked cacheable
+    """
+    if not messages:
+        return list(messages)
+
+    last = messages[-1]
+    content = last.content
+
+    if isinstance(content, str) and content:
+        blocks = [{"type": "text", "text": content, "cache_control": EPHEMERAL_CACHE}]
+    elif isinstance(content, list) and content and isinstance(content[-1], dict):
+        blocks = [*content[:-1], {**content[-1], "cache_control": EPHEMERAL_CACHE}]
+    else:
+        # Empty text (e.g. a pure tool-call message) cannot hold a breakpoint
+        return list(messages)
+
+    return [*messages[:-1], last.model_copy(update={"content": blocks})]
+
+
+def log_cache_usage(response: BaseMessage, node: str) -> None:
+    """Log prompt cache token usage reported on an LLM response.
+
+    Args:
+        response: The message returned by the LLM
+        node: Name of the node that made the call, used as log context
+    """
+    usage = getattr(response, "usage_metadata", None)
+    if not usage:
+        return
+
+    details = usage.get("input_token_details", {})
+    logger.info(
+        "%s token usage: input=%s, cache_creation=%s, cache_read=%s",
+        node,
+        usage.get("input_tokens"),
+        details.get("cache_creation"),
+        details.get("cache_read"),
+    )
@@ -1,3 +1,9 @@
+from typing import List
+
+from app.models import Route, RouteRequirements, Segment
+
+from .llm import build_system_block
+
 PLANNER_SYSTEM_PROMPT = """You are a bikepacking route planner assistant.
 
 Your responsibilities:
@@ -16,18 +22,9 @@ Your responsibilities:
 Be friendly and helpful in your responses.
 """
 
-ITINERARY_PROMPT_TEMPLATE = """The route has been successfully calculated and confirmed by the user!
-
-Route Details:
-- Origin: {origin}
-- Destination: {destination}
-- Total Distance: {distance_km:.2f} km
-- Daily Target: {daily_distance_km} km/day
+ITINERARY_SYSTEM_PROMPT = """The user's bikepacking route has been successfully calculated and confirmed!
 
-Calculated Segments:
-{segments}
-
-Please write a friendly, day-by-day itinerary for the user's bikepacking route. 
+Please write a friendly, day-by-day itinerary for the route described in the ROUTE_DATA section.
 Include:
 - Daily distances and key waypoints
 - 2 Accommodation recommendations for each night
@@ -38,27 +35,28 @@ Make it consice and actionable so the user can confidently embark on their journ
 
 OPTIMISER_SYSTEM_PROMPT = """You are a route modification agent.
 
-Context: You receive either:
-1. INITIAL OPTIMIZATION: Check for critical issues after route generation
-2. USER REQUEST: Execute the user's requested modification
+Context: You receive either an INITIAL OPTIMIZATION or a USER REQUEST.
+The mode for this call and its instructions follow this prompt.
+
+Do NOT:
+- Call tools multiple times
+- Call information gathering tools (get_route_summary, etc)
+- Analyze or explain
+
+You execute ONE modification and stop.
+"""
 
-For INITIAL OPTIMIZATION:
+OPTIMISER_MODE_INITIAL = """Mode: INITIAL OPTIMIZATION - Check for critical issues after route generation
 - Check if any days are missing accommodation -> use search_accommodation
 - Check if any distances are dangerous (>150km or <20km) -> use adjust_daily_distance
 - Call ONE tool if needed, then stop
 - If no critical issues respond with "Route created, generating summary..."
+"""
 
-For USER REQUEST:
+OPTIMISER_MODE_FEEDBACK = """Mode: USER REQUEST - Execute the user's requested modification
 - The user's last message describes what they want
 - Determine appropriate tool to call
 - Execute it once
-
-Do NOT:
-- Call tools multiple times
-- Call information gathering tools (get_route_summary, etc)
-- Analyze or explain
-
-You execute ONE modification and stop.
 """
 
 REVIEWER_INITIAL_PROMPT = """Present a comprehensive route overview.
@@ -77,14 +75,6 @@ Include:
 End by asking: "Would you like to proceed with this route or make adjustments?"
 """
 
-REVIEWER_CONFIRMED_PROMPT = """Acknowledge the user's route confirmation.
-
-Confirm that:
-- The route has been finalized
-- Detailed itinerary generation will begin
-- Be brief and enthusiastic
-"""
-
 REVIEWER_RESPONSE_PROMPT = """The user has responded to the route overview.
 
 Their message may contain:
@@ -102,3 +92,90 @@ Your job:
 
 After responding, always end with: "Would you like to proceed with this route or make adjustments?"
 """
+
+
+# Pre-built system blocks, so every call reuses one object per prompt
+PLANNER_SYSTEM_BLOCKS = build_system_block(PLANNER_SYSTEM_PROMPT)
+OPTIMISER_INITIAL_BLOCKS = build_system_block(
+    OPTIMISER_SYSTEM_PROMPT, OPTIMISER_MODE_INITIAL
+)
+OPTIMISER_FEEDBACK_BLOCKS = build_system_block(
+    OPTIMISER_SYSTEM_PROMPT, OPTIMISER_MODE_FEEDBACK
+)
+REVIEWER_INITIAL_BLOCKS = build_system_block(REVIEWER_INITIAL_PROMPT)
+REVIEWER_RESPONSE_BLOCKS = build_system_block(REVIEWER_RESPONSE_PROMPT)
+
+
+def format_segments_table(segments: List[Segment]) -> str:
+    """Render segments as a compact pipe-separated table for LLM context.
+
+    Field names appear once in the header rather than being repeated for
+    every segment, which keeps the prompt short for long trips.
+
+    Args:
+        segments: Daily segments in ascending order
+
+    Returns:
+        Header line followed by one row per segment
+    """
+    rows = (
+        f"{seg.day}|{seg.route.destination.name}|{seg.route.distance / 1000:.1f}|"
+        f"{seg.route.elevation_gain}|"
+        f"{'; '.join(acc.name for acc in seg.accommodation_options) or 'none'}"
+        for seg in segments
+    )
+    return "\n".join(("day|dest|km|elev_m|accommodation", *rows))
+
+
+def format_confirmation_message(
+    requirements: RouteRequirements, route: Route, segments: List[Segment]
+) -> str:
+    """Render the reviewer's acknowledgement of a confirmed route.
+
+    The acknowledgement only restates the finalised route, so it is built
+    from a template rather than asking the LLM.
+
+    Args:
+        requirements: Validated route requirements
+        route: The calculated overall route
+        segments: Daily segments in ascending order
+
+    Returns:
+        Message telling the user the route is final and the itinerary is next
+    """
+    days = len(segments)
+    return (
+        f"Your route from {requirements.origin.name} to "
+        f"{requirements.destination.name} is confirmed: "
+        f"{route.distance / 1000:.1f} km over {days} day{'s' if days != 1 else ''}. "
+        "I'll put together your detailed day-by-day itinerary now!"
+    )
+
+
+def format_itinerary_route_data(
+    requirements: RouteRequirements, route: Route, segments: List[Segment]
+) -> str:
+    """Render the ROUTE_DATA block that follows ITINERARY_SYSTEM_PROMPT.
+
+    Built from an f-string, which is compiled once with the module, rather
+    than a template that str.format has to re-parse on every call.
+
+    Args:
+        requirements: Validated route requirements
+        route: The calculated overall route
+        segments: Daily segments in ascending order
+
+    Returns:
+        Route data text to send after the cached itinerary instructions
+    """
+    return (
+        "---\n"
+        "ROUTE_DATA:\n"
+        f"- Origin: {requirements.origin.name}\n"
+        f"- Destination: {requirements.destination.name}\n"
+        f"- Total Distance: {route.distance / 1000:.2f} km\n"
+        f"- Daily Target: {requirements.daily_distance_km} km/day\n"
+        "\n"
+        "Calculated Segments:\n"
+        f"{format_segments_table(segments)}\n"
+    )
@@ -1,13 +1,12 @@
 import logging
+from functools import cache
 
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.prebuilt import ToolNode
 
-from app.agent.graph.routing import (route_after_accommodation,
-                                     route_optimiser, route_planner,
-                                     route_reviewer)
+from app.agent.graph.routing import route_after_accommodation
 from app.agent.nodes.logistics import find_accommodation_node
 from app.agent.nodes.optimiser import optimiser_node
 from app.agent.nodes.planner import parse_requirements_node, planner_node
@@ -20,21 +19,27 @@ from app.tools import OPTIMISATION_TOOLS, get_location, get_weather
 
 logger = logging.getLogger(__name__)
 
+# Tool nodes are stateless, so every compiled graph can share them
+_PLANNER_TOOL_NODE = ToolNode([get_location])
+_OPTIMISER_TOOL_NODE = ToolNode(OPTIMISATION_TOOLS)
+_REVIEWER_TOOL_NODE = ToolNode([get_weather])
+
 
 def determine_entry_point(state: AgentState) -> str:
     """Determine where to enter based on state."""
+    has_route, has_requirements, confirmed, awaiting = state.routing_view
 
     # 1. If the route is confirmed, go to writer
-    if state.user_confirmed:
+    if confirmed:
         return "writer"
 
     # 2. If we are waiting for response (flag set by reviewer node previously)
-    if state.awaiting_user_response and state.route and not state.user_confirmed:
+    if awaiting and has_route:
         # Note: We don't clear the flag here; we let the optimiser node handle the state update
         return "optimiser"
 
     # 3. Fallback for unexpected states or re-entry without waiting flag
-    if state.route and state.requirements:
+    if has_route and has_requirements:
         return "reviewer"
 
     # 4. Otherwise, start at planner (initial request)
@@ -78,37 +83,30 @@ def create_route_planner_graph() -> CompiledStateGraph:
 
     # === Phase 1: Planning Nodes ===
     workflow.add_node("planner", planner_node)
-    workflow.add_node("planner_tools", ToolNode([get_location]))
+    workflow.add_node("planner_tools", _PLANNER_TOOL_NODE)
     workflow.add_node("parser", parse_requirements_node)
 
     # === Phase 2: Route Calculation Nodes ===
+    # Route, segment and accommodation results are cached in app.utils.cache,
+    # shared with the tools, so these nodes need no node-level cache policy
     workflow.add_node("calculate_route", calculate_route_node)
     workflow.add_node("generate_waypoints", calculate_segments_node)
     workflow.add_node("find_accommodation", find_accommodation_node)
 
     # === Phase 3: Optimization & Confirmation ===
     workflow.add_node("optimiser", optimiser_node)
-    workflow.add_node("optimiser_tools", ToolNode(OPTIMISATION_TOOLS))
+    workflow.add_node("optimiser_tools", _OPTIMISER_TOOL_NODE)
 
     # === Phase 4: Review & Output ===
     workflow.add_node("reviewer", reviewer_node)
-    workflow.add_node("reviewer_tools", ToolNode([get_weather]))
+    workflow.add_node("reviewer_tools", _REVIEWER_TOOL_NODE)
     workflow.add_node("writer", itinerary_writer_node)
 
     # === Define Workflow Edges ===
 
     workflow.set_conditional_entry_point(determine_entry_point)
 
-    workflow.add_conditional_edges(
-        "planner",
-        route_planner,
-        {
-            "planner_tools": "planner_tools",  # Execute location lookup tools
-            "parser": "parser",  # Validate requirements
-            "optimiser": "optimiser",  # User feedback after review
-            END: END,  # Wait for user response
-        },
-    )
+    # Planner, optimiser and reviewer route themselves by returning Command(goto)
     workflow.add_edge("planner_tools", "planner")  # Loop back after tool execution
 
     # Transition to calculation phase
@@ -127,27 +125,9 @@ def create_route_planner_graph() -> CompiledStateGraph:
         },
     )
 
-    workflow.add_conditional_edges(
-        "optimiser",
-        route_optimiser,
-        {
-            "optimiser_tools": "optimiser_tools",  # Execute modification tools
-            "reviewer": "reviewer",  # Move to review (confirmed or first time)
-        },
-    )
     workflow.add_edge("optimiser_tools", "optimiser")  # Loop back after tool execution
 
     # Phase 4: Review & Output
-    workflow.add_conditional_edges(
-        "reviewer",
-        route_reviewer,
-        {
-            "reviewer_tools": "reviewer_tools",  # Tool execution (get_weather)
-            "writer": "writer",  # Final transition after confirmation
-            END: END,  # Wait for user response
-        },
-    )
-
     workflow.add_edge("reviewer_tools", "reviewer")  # Loop back after tool execution
     workflow.add_edge(
         "writer", END
@@ -162,5 +142,11 @@ def create_route_planner_graph() -> CompiledStateGraph:
     return app
 
 
-# Create the compiled application
-app = create_route_planner_graph()
+@cache
+def get_app() -> CompiledStateGraph:
+    """Return the process-wide compiled graph, building it on first use.
+
+    The graph owns the MemorySaver holding every session's state, so all
+    callers must share this single instance.
+    """
+    return create_route_planner_graph()
@@ -1,14 +1,24 @@
+import asyncio
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List
 
-from app.models import AgentState
-from app.utils import get_accommodation
+from app.config import settings
+from app.models import Accommodation, AgentState, Segment
+from app.utils import (accommodation_cache, find_days_without_accommodation,
+                       get_cached_accommodation)
 
 logger = logging.getLogger(__name__)
 
 
-def find_accommodation_node(state: AgentState) -> Dict[str, Any]:
-    """Find accommodation and determine if optimization needed."""
+async def find_accommodation_node(state: AgentState) -> Dict[str, Any]:
+    """Find accommodation and determine if optimization needed.
+
+    Lookups for every segment run concurrently in worker threads, bounded
+    by ACCOMMODATION_CONCURRENCY_LIMIT, so the node takes roughly as long as the
+    slowest request rather than the sum of all of them. Destinations seen
+    before (e.g. when the optimiser recalculates a route) are served from
+    the shared accommodation cache.
+    """
 
     segments = state.segments
 
@@ -16,16 +26,26 @@ def find_accommodation_node(state: AgentState) -> Dict[str, Any]:
         error_msg = "Accommodaion search requires validated segments"
         raise ValueError(error_msg)
 
-    logger.info(f"Finding accommodation for {len(segments)} nights")
+    logger.info("Finding accommodation for %d nights", len(segments))
+
+    semaphore = asyncio.Semaphore(settings.ACCOMMODATION_CONCURRENCY_LIMIT)
+
+    async def lookup(seg: Segment) -> List[Accommodation]:
+        async with semaphore:
+            return await asyncio.to_thread(
+                get_cached_accommodation, seg.route.destination.coordinates
+            )
 
-    days_without_accommodation = []
+    results = await asyncio.gather(*(lookup(seg) for seg in segments))
+    accommodation_cache.log_stats()
 
-    for seg in segments:
-        accommodation_opts = get_accommodation(seg.route.destination.coordinates)
+    # Merge results on the event loop once all lookups have finished
+    for seg, accommodation_opts in zip(segments, results):
         seg.accommodation_options += accommodation_opts
-        if len(seg.accommodation_options) == 0:
-            days_without_accommodation.append(seg.day)
 
     return {
         "segments": segments,
+        "days_without_accommodation": find_days_without_accommodation(segments),
+        # A freshly calculated route has not been through the optimiser yet
+        "route_optimised": False,
     }
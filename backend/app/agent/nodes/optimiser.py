@@ -1,41 +1,107 @@
 import logging
-from typing import Any, Dict
-
-from langchain_core.messages import HumanMessage
-
-from app.agent.config import OPTIMISER_SYSTEM_PROMPT, create_llm_with_tools
+from functools import cache
+from typing import Any, Dict, List, Literal, Tuple
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import HumanMessage, ToolMessage
+from langgraph.types import Command
+
+from app.agent.config import (OPTIMISER_FEEDBACK_BLOCKS,
+                              OPTIMISER_INITIAL_BLOCKS, create_llm_with_tools,
+                              log_cache_usage, trim_history,
+                              with_history_breakpoint)
+from app.agent.graph.routing import get_tool_calls
 from app.models import AgentState
 from app.tools import OPTIMISATION_TOOLS
 
 logger = logging.getLogger(__name__)
 
-_llm_with_tools = create_llm_with_tools(tools=OPTIMISATION_TOOLS)
 
+@cache
+def _get_llm() -> BaseChatModel:
+    """Return the optimiser LLM, binding its tools on first use."""
+    return create_llm_with_tools(tools=OPTIMISATION_TOOLS)
+
+
+# Optimiser tools that only read state rather than changing the route
+_READ_ONLY_TOOL_NAMES = frozenset(
+    ["get_route_summary", "get_segment_details", "get_weather", "confirm_route"]
+)
+
+_TOOL_NAMES = frozenset(tool.name for tool in OPTIMISATION_TOOLS)
+
+# Tool calls that show the optimiser has already changed the route
+_OPTIMISATION_TOOL_NAMES = frozenset(
+    tool.name for tool in OPTIMISATION_TOOLS if tool.name not in _READ_ONLY_TOOL_NAMES
+)
+
+_ALREADY_OPTIMISED_REQUEST = (
+    "Route already optimized. Do not change. Proceed to reviewer."
+)
 
-def optimiser_node(state: AgentState) -> Dict[str, Any]:
+# Daily distances outside this range (km) count as critical, as in the prompt
+MIN_SAFE_DAILY_KM = 20
+MAX_SAFE_DAILY_KM = 150
+
+
+def optimiser_node(
+    state: AgentState,
+) -> Command[Literal["optimiser_tools", "reviewer"]]:
     """Enhanced optimiser that handles both optimization and confirmation."""
     logger.info("Optimizer node: Starting optimization/confirmation check")
 
-    optimization_request = _build_optimization_request(state)
+    if _is_clean_first_pass(state):
+        logger.info("Optimizer skipped: no critical issues on first pass")
+        return Command(
+            update={
+                "awaiting_user_response": False,
+                "critical_optimization_done": True,
+            },
+            goto="reviewer",
+        )
+
+    optimization_request, system = _build_optimization_request(state)
+
+    history = with_history_breakpoint(trim_history(state.messages))
+    response = _get_llm().invoke(history + [optimization_request], system=system)
+    log_cache_usage(response, "Optimizer")
+
+    tool_calls = get_tool_calls(response)
 
-    response = _llm_with_tools.invoke(
-        state.messages + [optimization_request], system=OPTIMISER_SYSTEM_PROMPT
+    # Carry the flag within a turn; user feedback starts a new optimisation
+    changed_route = any(tc.get("name") in _OPTIMISATION_TOOL_NAMES for tc in tool_calls)
+    route_optimised = changed_route or (
+        state.route_optimised and not _has_user_feedback(state)
     )
 
-    updates = {"messages": [response], "awaiting_user_response": False}
+    updates = {
+        "messages": [response],
+        "awaiting_user_response": False,
+        "route_optimised": route_optimised,
+    }
 
-    if hasattr(response, "tool_calls") and response.tool_calls:
-        tool_names = [tc.get("name") for tc in response.tool_calls]
+    if not tool_calls:
+        # Handing over to the reviewer ends the critical optimisation pass
+        updates["critical_optimization_done"] = True
+
+    if tool_calls and logger.isEnabledFor(logging.INFO):
+        tool_names = [tc.get("name") for tc in tool_calls]
         if "confirm_route" in tool_names:
             logger.info("Optimizer confirmed route is ready")
         else:
-            logger.info(f"Optimizer requesting tools: {tool_names}")
+            logger.info("Optimizer requesting tools: %s", ", ".join(tool_names))
+
+    return Command(update=updates, goto="optimiser_tools" if tool_calls else "reviewer")
 
-    return updates
 
+def _build_optimization_request(
+    state: AgentState,
+) -> Tuple[HumanMessage, List[Dict[str, Any]]]:
+    """Build a message requesting route optimization/confirmation.
 
-def _build_optimization_request(state: AgentState) -> Any:
-    """Build a message requesting route optimization/confirmation."""
+    Returns the request along with the system blocks for the matching mode:
+    the shared optimiser prompt (cached) followed by the mode instructions.
+    """
     segments = state.segments
     requirements = state.requirements
 
@@ -44,27 +110,8 @@ def _build_optimization_request(state: AgentState) -> Any:
             "Route optimization requires generated segments and requirements"
         )
 
-    has_user_feedback = False
-    if len(state.messages) > 0:
-        last_msg = state.messages[-1]
-        if hasattr(last_msg, "type") and last_msg.type == "human":
-            has_user_feedback = True
-
-    optimiser_already_ran = False
-    if not has_user_feedback and len(state.messages) > 5:
-        for msg in reversed(state.messages[-10:]):
-            if hasattr(msg, "tool_calls") and msg.tool_calls:  # type:ignore
-                tool_names = [tc.get("name") for tc in msg.tool_calls]  # type: ignore
-                if any(
-                    tool in tool_names
-                    for tool in [
-                        "adjust_daily_distance",
-                        "search_accommodation",
-                        "modify_waypoint",
-                    ]
-                ):
-                    optimiser_already_ran = True
-                    break
+    has_user_feedback = _has_user_feedback(state)
+    optimiser_already_ran = not has_user_feedback and state.route_optimised
 
     if has_user_feedback:
         request = (
@@ -73,12 +120,58 @@ def _build_optimization_request(state: AgentState) -> Any:
             f"Tasks: Interpret intent, modify route if requested, or confirm_route if satisfied."
         )
     elif optimiser_already_ran:
-        request = "Route already optimized. Do not change. Proceed to reviewer."
+        request = _ALREADY_OPTIMISED_REQUEST
     else:
+        missing = _format_days(state.days_without_accommodation)
         request = (
             f"First optimization pass. {len(segments)} days.\n"
+            f"Days without accommodation: {missing}\n"
             f"Only fix CRITICAL issues (missing accommodation, dangerous distances).\n"
             f"If no critical issues, call NO tools."
         )
 
-    return HumanMessage(content=request)
+    system = (
+        OPTIMISER_FEEDBACK_BLOCKS if has_user_feedback else OPTIMISER_INITIAL_BLOCKS
+    )
+
+    return HumanMessage(content=request), system
+
+
+def _is_clean_first_pass(state: AgentState) -> bool:
+    """Whether a first pass would be told to change nothing.
+
+    The first pass only fixes missing accommodation and dangerous daily
+    distances. When neither is present the model is asked to call no tools,
+    so the call can be skipped. Re-entries with results from the
+    optimiser's own tools always go back to the model.
+    """
+    if not state.segments or _has_user_feedback(state) or state.route_optimised:
+        return False
+    if _has_tool_result(state):
+        return False
+    if state.days_without_accommodation:
+        return False
+    return all(
+        MIN_SAFE_DAILY_KM <= seg.route.distance / 1000 <= MAX_SAFE_DAILY_KM
+        for seg in state.segments
+    )
+
+
+def _has_user_feedback(state: AgentState) -> bool:
+    """Whether the optimiser is handling a user reply to the overview."""
+    return bool(state.messages) and (
+        getattr(state.messages[-1], "type", None) == "human"
+    )
+
+
+def _has_tool_result(state: AgentState) -> bool:
+    """Whether the optimiser is being re-entered with one of its tool results."""
+    return bool(state.messages) and (
+        isinstance(state.messages[-1], ToolMessage)
+        and state.messages[-1].name in _TOOL_NAMES
+    )
+
+
+def _format_days(days: List[int]) -> str:
+    """Render day numbers for the optimiser request."""
+    return ", ".join(str(day) for day in days) or "none"
@@ -1,20 +1,31 @@
 import logging
-from typing import Any, Dict
+from functools import cache
+from typing import Any, Dict, Literal
 
+from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import ToolMessage
+from langgraph.graph import END
+from langgraph.types import Command
 
-from app.agent.config import PLANNER_SYSTEM_PROMPT, create_llm_with_tools
+from app.agent.config import (PLANNER_SYSTEM_BLOCKS, create_llm_with_tools,
+                              log_cache_usage, trim_history,
+                              with_history_breakpoint)
+from app.agent.graph.routing import get_tool_calls
 from app.models import AgentState, RouteRequirements
 from app.tools import get_location
 
 logger = logging.getLogger(__name__)
 
 
-# Initialize LLM with tools
-_llm_with_tools = create_llm_with_tools(tools=[get_location, RouteRequirements])
+@cache
+def _get_llm() -> BaseChatModel:
+    """Return the planner LLM, binding its tools on first use."""
+    return create_llm_with_tools(tools=[get_location, RouteRequirements])
 
 
-def planner_node(state: AgentState) -> Dict[str, Any]:
+def planner_node(
+    state: AgentState,
+) -> Command[Literal["planner_tools", "parser", "__end__"]]:
     """Main planning node that gathers route requirements from the user.
 
     This node uses an LLM to:
@@ -26,18 +37,32 @@ def planner_node(state: AgentState) -> Dict[str, Any]:
         state: Current agent state with message history
 
     Returns:
-        Dictionary with new messages to add to state
+        Command adding the response to state and routing to the parser once
+        requirements are submitted, to the planner tools for location
+        lookups, or to END to wait for the user
     """
     logger.info("Planner node: Processing user request")
 
-    response = _llm_with_tools.invoke(state.messages, system=PLANNER_SYSTEM_PROMPT)
+    response = _get_llm().invoke(
+        with_history_breakpoint(trim_history(state.messages)),
+        system=PLANNER_SYSTEM_BLOCKS,
+    )
+    log_cache_usage(response, "Planner")
 
-    # Log tool calls if any
-    if hasattr(response, "tool_calls") and response.tool_calls:
-        tool_names = [tc.get("name") for tc in response.tool_calls]
-        logger.info(f"Planner requesting tools: {tool_names}")
+    # Log tool calls if any, skipping the join when INFO is disabled
+    tool_calls = get_tool_calls(response)
+    if tool_calls and logger.isEnabledFor(logging.INFO):
+        tool_names = ", ".join(tc.get("name") for tc in tool_calls)
+        logger.info("Planner requesting tools: %s", tool_names)
 
-    return {"messages": [response]}
+    if not tool_calls:
+        goto = END
+    elif tool_calls[0].get("name") == "RouteRequirements":
+        goto = "parser"
+    else:
+        goto = "planner_tools"
+
+    return Command(update={"messages": [response]}, goto=goto)
 
 
 def parse_requirements_node(state: AgentState) -> Dict[str, Any]:
@@ -58,14 +83,14 @@ def parse_requirements_node(state: AgentState) -> Dict[str, Any]:
     """
     logger.info("Parsing route requirements from tool call")
 
-    last_message = state.messages[-1]
+    tool_calls = get_tool_calls(state.messages[-1])
 
-    if not hasattr(last_message, "tool_calls") or not last_message.tool_calls:  # type: ignore
+    if not tool_calls:
         error_msg = "Expected RouteRequirements tool call but found none"
         logger.error(error_msg)
         raise ValueError(error_msg)
 
-    tool_call = last_message.tool_calls[0]  # type: ignore
+    tool_call = tool_calls[0]
 
     if tool_call.get("name") != "RouteRequirements":
         error_msg = f"Expected RouteRequirements, got {tool_call.get('name')}"
@@ -74,11 +99,13 @@ def parse_requirements_node(state: AgentState) -> Dict[str, Any]:
 
     try:
         # Validate and parse requirements
-        requirements = RouteRequirements(**tool_call["args"])
+        requirements = RouteRequirements.model_validate(tool_call["args"])
 
         logger.info(
-            f"Requirements validated: {requirements.origin.name} -> "
-            f"{requirements.destination.name} ({requirements.daily_distance_km}km/day)"
+            "Requirements validated: %s -> %s (%skm/day)",
+            requirements.origin.name,
+            requirements.destination.name,
+            requirements.daily_distance_km,
         )
 
         # Create success message
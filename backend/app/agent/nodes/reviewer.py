@@ -1,17 +1,49 @@
 import logging
-from typing import Any, Dict
-
-from langchain_core.messages import HumanMessage, ToolMessage
-
-from app.agent.config import (REVIEWER_CONFIRMED_PROMPT,
-                              REVIEWER_INITIAL_PROMPT,
-                              REVIEWER_RESPONSE_PROMPT, create_llm_with_tools)
+from functools import cache
+from itertools import islice
+from typing import Literal, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langgraph.graph import END
+from langgraph.types import Command
+
+from app.agent.config import (REVIEWER_INITIAL_BLOCKS,
+                              REVIEWER_RESPONSE_BLOCKS, create_llm_with_tools,
+                              format_confirmation_message, log_cache_usage)
+from app.agent.graph.routing import get_tool_calls
 from app.models.state import AgentState
 from app.tools import get_weather
 
 logger = logging.getLogger(__name__)
 
-_llm = create_llm_with_tools([get_weather])
+
+@cache
+def _get_llm() -> BaseChatModel:
+    """Return the reviewer LLM, binding its tools on first use."""
+    return create_llm_with_tools([get_weather])
+
+
+# Recent tool calls mapped to the change they describe, in reporting order
+_TOOL_CHANGE_CATEGORIES = (
+    (frozenset({"get_segment_details"}), "Retrieved detailed segment information"),
+    (frozenset({"get_route_summary"}), "Analyzed route summary"),
+    (
+        frozenset({"search_accommodation_for_day"}),
+        "Searched for additional accommodation options",
+    ),
+    (
+        frozenset(
+            {
+                "adjust_daily_distance",
+                "add_intermediate_waypoint",
+                "remove_intermediate_waypoint",
+                "recalculate_complete_route",
+            }
+        ),
+        "Modified route segments",
+    ),
+)
 
 
 def _check_for_recent_changes(state: AgentState) -> str:
@@ -19,31 +51,16 @@ def _check_for_recent_changes(state: AgentState) -> str:
     if not state.messages or len(state.messages) < 2:
         return ""
 
-    recent_tools_used = []
-    for msg in reversed(state.messages[-5:]):  # Check only last 5 messages
-        if hasattr(msg, "tool_calls") and msg.tool_calls:  # type: ignore
-            for tool_call in msg.tool_calls:  # type: ignore
-                tool_name = tool_call.get("name", "")
-                if tool_name and tool_name != "confirm_route":
-                    recent_tools_used.append(tool_name)
-
-    if not recent_tools_used:
-        return ""
+    tool_set = set()
+    for msg in islice(reversed(state.messages), 5):  # Check only last 5 messages
+        tool_set.update(tool_call.get("name", "") for tool_call in get_tool_calls(msg))
 
     # Create a summary of what was done
-    changes = []
-    tool_set = set(recent_tools_used)
-
-    if "get_segment_details" in tool_set:
-        changes.append("Retrieved detailed segment information")
-    if "get_route_summary" in tool_set:
-        changes.append("Analyzed route summary")
-    if "search_accommodation" in tool_set:
-        changes.append("Searched for additional accommodation options")
-    if "adjust_segment_distance" in tool_set or "modify_waypoint" in tool_set:
-        changes.append("Modified route segments")
-
-    return ", ".join(changes) if changes else ""
+    return ", ".join(
+        description
+        for tool_names, description in _TOOL_CHANGE_CATEGORIES
+        if not tool_names.isdisjoint(tool_set)
+    )
 
 
 def _get_recent_tool_outputs(state: AgentState) -> str:
@@ -60,7 +77,7 @@ def _get_recent_tool_outputs(state: AgentState) -> str:
     tool_outputs = []
     # Look back through recent history (last 10 messages to be safe)
     # We are looking for ToolMessages that might contain relevant info (like weather)
-    for msg in reversed(state.messages[-10:]):
+    for msg in islice(reversed(state.messages), 10):
         if isinstance(msg, ToolMessage):
             # We found data!
             tool_outputs.append(f"Data from {msg.name}: {msg.content}")
@@ -71,6 +88,20 @@ def _get_recent_tool_outputs(state: AgentState) -> str:
     return "\n\n".join(tool_outputs)
 
 
+def _latest_user_message(state: AgentState) -> Optional[HumanMessage]:
+    """Return the user's message this turn, if it replies to an overview.
+
+    The turn that first builds the route submits RouteRequirements before
+    reaching the reviewer, so its overview is the initial one.
+    """
+    for msg in reversed(state.messages):
+        if isinstance(msg, HumanMessage):
+            return msg
+        if any(tc.get("name") == "RouteRequirements" for tc in get_tool_calls(msg)):
+            return None
+    return None
+
+
 def _build_state_summary(state: AgentState) -> str:
     # Validate required data is present
     if not state.requirements:
@@ -80,8 +111,8 @@ def _build_state_summary(state: AgentState) -> str:
     if not state.segments:
         raise ValueError("Overview generation requires generated segments")
 
-    # Serialize the state for the LLM
-    state_summary = f"""Current Route State:
+    # Serialize the state for the LLM, collecting parts to join once
+    header = f"""Current Route State:
 
     Requirements:
     - Origin: {state.requirements.origin.name}
@@ -95,56 +126,63 @@ def _build_state_summary(state: AgentState) -> str:
     Daily Segments:
     """
 
-    for seg in state.segments:
-        state_summary += f"""
+    parts = [header]
+    parts.extend(f"""
     Day {seg.day}: {seg.route.distance / 1000:.1f} km, {seg.route.origin.name} -> {seg.route.destination.name}
-    """
+    """ for seg in state.segments)
 
     # Check for recent optimiser changes (Actions taken)
     recent_changes = _check_for_recent_changes(state)
 
     if recent_changes:
-        state_summary += f"\n\nRecent Actions Taken: {recent_changes}"
+        parts.append(f"\n\nRecent Actions Taken: {recent_changes}")
     else:
-        state_summary += "\n\nThis is the initial route overview."
+        parts.append("\n\nThis is the initial route overview.")
 
-    return state_summary
+    return "".join(parts)
 
 
-def reviewer_node(state: AgentState) -> Dict[str, Any]:
-    """Present overview based on state."""
+async def reviewer_node(
+    state: AgentState,
+) -> Command[Literal["reviewer_tools", "writer", "__end__"]]:
+    """Present overview based on state.
 
-    # Determine mode
-    if state.user_confirmed:
-        prompt = REVIEWER_CONFIRMED_PROMPT
-    else:
-        # Check if optimiser just ran
-        optimiser_just_ran = not state.critical_optimization_done
+    Routes to the reviewer tools when the overview needs tool data, to the
+    writer once the route is confirmed, and otherwise to END to wait for
+    the user.
+    """
 
-        if optimiser_just_ran:
-            prompt = REVIEWER_INITIAL_PROMPT
-        else:
-            # This is a response after user feedback
-            prompt = REVIEWER_RESPONSE_PROMPT
+    # A confirmed route only needs acknowledging before the writer takes over
+    if state.user_confirmed:
+        message = format_confirmation_message(
+            state.requirements, state.route, state.segments  # type: ignore
+        )
+        return Command(update={"messages": [AIMessage(content=message)]}, goto="writer")
 
     base_summary = _build_state_summary(state)
     tool_data = _get_recent_tool_outputs(state)
 
     full_context = base_summary
+
+    # The first overview follows route calculation; later ones answer feedback
+    user_message = _latest_user_message(state)
+    if user_message is None:
+        system = REVIEWER_INITIAL_BLOCKS
+    else:
+        system = REVIEWER_RESPONSE_BLOCKS
+        full_context += f"\n\nUser's message: {user_message.content}"
+
     if tool_data:
         full_context += f"\n\n=== RECENT TOOL DATA (Weather/Info) ===\n{tool_data}\n\nINSTRUCTION: Incorporate the tool data above into your overview if relevant."
 
-    logger.info(f"Reviewer context length: {len(full_context)}")
+    logger.info("Reviewer context length: %d", len(full_context))
 
-    response = _llm.invoke(
-        [HumanMessage(content=full_context)],
-        system=prompt,
+    response = await _get_llm().ainvoke(
+        [HumanMessage(content=full_context)], system=system
     )
+    log_cache_usage(response, "Reviewer")
 
-    updates = {"messages": [response]}
-
-    # Ensure we set the waiting flag if not confirmed
-    if not state.user_confirmed:
-        updates["awaiting_user_response"] = True  # type: ignore
+    updates = {"messages": [response], "awaiting_user_response": True}
+    goto = "reviewer_tools" if get_tool_calls(response) else END
 
-    return updates
+    return Command(update=updates, goto=goto)
@@ -2,7 +2,7 @@ import logging
 from typing import Any, Dict, List
 
 from app.models import AgentState, Segment
-from app.utils import calculate_segments, fetch_route
+from app.utils import get_cached_route, get_cached_segments
 
 logger = logging.getLogger(__name__)
 
@@ -31,22 +31,25 @@ def calculate_route_node(state: AgentState) -> Dict[str, Any]:
         raise ValueError(error_msg)
 
     logger.info(
-        f"Calculating route: {requirements.origin.name} -> "
-        f"{requirements.destination.name}"
+        "Calculating route: %s -> %s",
+        requirements.origin.name,
+        requirements.destination.name,
     )
 
     if requirements.intermediates:
-        intermediate_names = [loc.name for loc in requirements.intermediates]
-        logger.info(f"Intermediate stops: {', '.join(intermediate_names)}")
+        logger.info(
+            "Intermediate stops: %s",
+            ", ".join(loc.name for loc in requirements.intermediates),
+        )
 
     try:
-        route = fetch_route(
+        route = get_cached_route(
             origin=requirements.origin,
             destination=requirements.destination,
             intermediates=requirements.intermediates,
         )
 
-        logger.info(f"Route calculated successfully: {route.distance / 1000:.2f} km")
+        logger.info("Route calculated successfully: %.2f km", route.distance / 1000)
 
         return {"route": route}
 
@@ -88,16 +91,17 @@ def calculate_segments_node(state: AgentState) -> Dict[str, Any]:
     daily_distance_m = requirements.daily_distance_km * 1000
 
     logger.info(
-        f"Generating segments for {requirements.daily_distance_km}km/day target "
-        f"(total distance: {route.distance / 1000:.2f}km)"
+        "Generating segments for %skm/day target (total distance: %.2fkm)",
+        requirements.daily_distance_km,
+        route.distance / 1000,
     )
 
     try:
-        segments: List[Segment] = calculate_segments(
+        segments: List[Segment] = get_cached_segments(
             route.polyline, daily_distance_m, route.origin, route.destination
         )
 
-        logger.info(f"Generated {len(segments)} segments")
+        logger.info("Generated %d segments", len(segments))
 
         return {"segments": segments}
 
@@ -1,17 +1,25 @@
 import logging
+from functools import cache
 from typing import Any, Dict
 
+from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage
 
-from app.agent.config import ITINERARY_PROMPT_TEMPLATE, create_llm
+from app.agent.config import (ITINERARY_SYSTEM_PROMPT, build_system_block,
+                              format_itinerary_route_data, get_shared_llm,
+                              log_cache_usage)
 from app.models import AgentState
 
 logger = logging.getLogger(__name__)
 
-_llm = create_llm()
 
+@cache
+def _get_llm() -> BaseChatModel:
+    """Return the writer LLM, sharing the client used by the other nodes."""
+    return get_shared_llm()
 
-def itinerary_writer_node(state: AgentState) -> Dict[str, Any]:
+
+async def itinerary_writer_node(state: AgentState) -> Dict[str, Any]:
     """Generate a friendly itinerary summary for the user.
 
     This node takes the calculated route and segments and uses an LLM
@@ -49,28 +57,20 @@ def itinerary_writer_node(state: AgentState) -> Dict[str, Any]:
 
     logger.info("Generating itinerary summary")
 
-    # Format segments for display
-    segments_str = "\n".join(f"Day {i+1}: {wp}" for i, wp in enumerate(segments))
-
-    # Construct the system prompt with route data
-    system_prompt = ITINERARY_PROMPT_TEMPLATE.format(
-        origin=requirements.origin.name,
-        destination=requirements.destination.name,
-        distance_km=route.distance / 1000,
-        daily_distance_km=requirements.daily_distance_km,
-        segments=segments_str,
-    )
+    # Route data goes after the static instructions so they stay cacheable
+    route_data = format_itinerary_route_data(requirements, route, segments)
 
     try:
         # Generate the itinerary
-        response = _llm.invoke(
+        response = await _get_llm().ainvoke(
             [
                 HumanMessage(
                     content="Please create a day-by-day itinerary based on the route data."
                 )
             ],
-            system=system_prompt,
+            system=build_system_block(ITINERARY_SYSTEM_PROMPT, route_data),
         )
+        log_cache_usage(response, "Writer")
 
         logger.info("Itinerary generated successfully")
 
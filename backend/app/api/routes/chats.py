@@ -32,14 +32,14 @@ async def chat_stream(
     session_id = request.session_id
     if not session_id:
         session_id = session_manager.create_session()
-        logger.info(f"Created new session for streaming: {session_id}")
+        logger.info("Created new session for streaming: %s", session_id)
     else:
         if not session_manager.session_exists(session_id):
             raise HTTPException(
                 status_code=404, detail=f"Session {session_id} not found"
             )
 
-    logger.info(f"Starting chat stream for session {session_id}")
+    logger.info("Starting chat stream for session %s", session_id)
 
     # Return SSE stream
     return EventSourceResponse(stream_chat_response(request.message, session_id))
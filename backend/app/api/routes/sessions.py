@@ -1,7 +1,7 @@
 import logging
 from typing import Dict
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 
 from app.api.deps import SessionManagerDep
 from app.models import AgentState, Route, Segment
@@ -19,7 +19,7 @@ async def create_session(session_manager: SessionManagerDep):
         Dictionary with the new session_id
     """
     session_id = session_manager.create_session()
-    logger.info(f"Created session via API: {session_id}")
+    logger.info("Created session via API: %s", session_id)
 
     return {"session_id": session_id, "message": "Session created successfully"}
 
@@ -58,9 +58,9 @@ def get_route(session_manager: SessionManagerDep, session_id: str):
         HTTPException: If session not found
     """
     try:
-        state = session_manager.get_session_state(session_id)
+        body = session_manager.get_serialized(session_id, "route")
 
-        return state.route
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=e)
 
@@ -79,8 +79,8 @@ def get_segments(session_manager: SessionManagerDep, session_id: str):
         HTTPException: If session not found
     """
     try:
-        state = session_manager.get_session_state(session_id)
+        body = session_manager.get_serialized(session_id, "segments")
 
-        return state.segments
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=e)
@@ -2,15 +2,28 @@ import logging
 import uuid
 from datetime import datetime, timezone
 from threading import Lock
-from typing import Dict
+from typing import Dict, List, Optional
 
 from langchain_core.runnables import RunnableConfig
+from pydantic import TypeAdapter
 
-from app.agent.graph.workflow import app
+from app.agent.graph.workflow import get_app
+from app.models import Route, Segment
 from app.models.state import AgentState
+from app.utils import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Sessions whose validated state is kept, and for how many seconds
+STATE_CACHE_SIZE = 256
+STATE_CACHE_TTL = 60 * 60
+
+# JSON encoders for the state fields served directly as response bodies
+SERIALIZERS: Dict[str, TypeAdapter] = {
+    "route": TypeAdapter(Optional[Route]),
+    "segments": TypeAdapter(Optional[List[Segment]]),
+}
+
 
 class SessionManager:
     """Manages conversation sessions in memory.
@@ -21,6 +34,14 @@ class SessionManager:
 
     def __init__(self):
         self._sessions: Dict[str, Dict] = {}
+        # Validated state keyed by (session id, checkpoint id)
+        self._state_cache: TTLCache[AgentState] = TTLCache(
+            "Session state", STATE_CACHE_SIZE, STATE_CACHE_TTL
+        )
+        # JSON bodies keyed by (session id, checkpoint id, field)
+        self._serialized: TTLCache[bytes] = TTLCache(
+            "Serialized state", STATE_CACHE_SIZE, STATE_CACHE_TTL
+        )
         self._lock = Lock()
         logger.info("SessionManager initialized with in-memory storage")
 
@@ -31,20 +52,27 @@ class SessionManager:
             str: The new session ID
         """
         session_id = str(uuid.uuid4())
+        now = datetime.now(timezone.utc)
 
         with self._lock:
             self._sessions[session_id] = {
-                "created_at": datetime.now(timezone.utc),
-                "last_updated": datetime.now(timezone.utc),
+                "created_at": now,
+                "last_updated": now,
                 "message_count": 0,
             }
 
-        logger.info(f"Created new session: {session_id}")
+        logger.info("Created new session: %s", session_id)
         return session_id
 
     def get_session_state(self, session_id: str) -> AgentState:
         """Get the current state of a session.
 
+        The validated state is cached until the session's latest checkpoint
+        changes, so the state, route and segments endpoints share one
+        materialisation per agent turn. Entries for idle sessions and
+        superseded checkpoints age out of the bounded cache. Callers must not
+        mutate the result.
+
         Args:
             session_id: The session ID
 
@@ -54,21 +82,62 @@ class SessionManager:
         Raises:
             ValueError: If session not found
         """
-        if not self.session_exists(session_id):
-            raise ValueError(f"Session {session_id} not found")
-
+        version = self._get_version(session_id)
         config = RunnableConfig(configurable={"thread_id": session_id})
 
         try:
-            # Get the current state from LangGraph
-            state = app.get_state(config)
-
-            return AgentState.model_validate(state.values)
+            # Get the current state from LangGraph on a miss
+            return self._state_cache.get_or_set(
+                (session_id, version),
+                lambda: AgentState.from_graph_values(
+                    get_app().get_state(config).values
+                ),
+            )
 
         except Exception as e:
-            logger.error(f"Error getting state for session {session_id}: {str(e)}")
+            logger.error("Error getting state for session %s: %s", session_id, e)
             raise
 
+    def get_serialized(self, session_id: str, field: str) -> bytes:
+        """Get a state field as JSON, serializing it once per checkpoint.
+
+        Args:
+            session_id: The session ID
+            field: Name of the state field, one of SERIALIZERS
+
+        Returns:
+            JSON encoding of the field's current value
+
+        Raises:
+            ValueError: If session not found
+        """
+        version = self._get_version(session_id)
+
+        return self._serialized.get_or_set(
+            (session_id, version, field),
+            lambda: SERIALIZERS[field].dump_json(
+                getattr(self.get_session_state(session_id), field)
+            ),
+        )
+
+    def _get_version(self, session_id: str) -> Optional[str]:
+        """Return the id of the session's latest checkpoint.
+
+        The checkpoint id changes whenever the graph saves new state, so it
+        versions every cached view of that state.
+
+        Raises:
+            ValueError: If session not found
+        """
+        if not self.session_exists(session_id):
+            raise ValueError(f"Session {session_id} not found")
+
+        config = RunnableConfig(configurable={"thread_id": session_id})
+        checkpoint = get_app().checkpointer.get_tuple(config)
+        return (
+            checkpoint.config["configurable"]["checkpoint_id"] if checkpoint else None
+        )
+
     def session_exists(self, session_id: str) -> bool:
         """Check if a session exists.
 
@@ -78,5 +147,6 @@ class SessionManager:
         Returns:
             True if session exists, False otherwise
         """
-        with self._lock:
-            return session_id in self._sessions
+        # A single dict membership test is atomic, so reads skip the lock that
+        # serialises writers
+        return session_id in self._sessions
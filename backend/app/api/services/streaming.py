@@ -1,14 +1,42 @@
-import json
 import logging
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
 
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import AIMessageChunk, HumanMessage
 from langchain_core.runnables import RunnableConfig
+from pydantic_core import to_json
 
-from app.agent.graph.workflow import app
+from app.agent.graph.workflow import get_app
 
 logger = logging.getLogger(__name__)
 
+# Nodes whose LLM output is forwarded token by token as it is generated
+TOKEN_STREAMING_NODES = frozenset({"reviewer", "writer"})
+
+
+def _sse_data(event_data: Dict[str, Any]) -> str:
+    """Format an event as an SSE data line.
+
+    pydantic's Rust JSON encoder is several times faster than the stdlib
+    json module for these small payloads, which are sent once per token.
+    """
+    return f"data: {to_json(event_data).decode()}\n\n"
+
+
+def _message_event(content, session_json: str) -> str:
+    """Format an AI message (or part of one) as an SSE data line.
+
+    Only the content is encoded per call; the envelope is a fixed template,
+    since this runs once per streamed token.
+
+    Args:
+        content: The message content
+        session_json: The session ID, already encoded as a JSON string
+    """
+    return (
+        'data: {"event":"message","data":{"content":'
+        f'{to_json(content).decode()},"type":"ai","session_id":{session_json}}}}}\n\n'
+    )
+
 
 async def stream_chat_response(
     message: str, session_id: str
@@ -27,17 +55,40 @@ async def stream_chat_response(
         # Create the config for LangGraph with the session ID
         config = RunnableConfig(configurable={"thread_id": session_id})
 
-        logger.info(f"Starting stream for session {session_id}")
+        logger.info("Starting stream for session %s", session_id)
+
+        # Encoded once for every message event in this stream
+        session_json = to_json(session_id).decode()
 
         # Track if we've sent any data
         sent_data = False
 
-        # Stream events from the graph
-        async for event in app.astream(
-            {"messages": [HumanMessage(content=message)]}, config, stream_mode="values"
+        # IDs of messages already sent as tokens, so the final state does not
+        # repeat them
+        streamed_ids = set()
+
+        # Stream events from the graph. Every turn runs through to END, so the
+        # state is only checkpointed once the run exits rather than per step.
+        async for mode, event in get_app().astream(
+            {"messages": [HumanMessage(content=message)]},
+            config,
+            stream_mode=["messages", "values"],
+            durability="exit",
         ):
             sent_data = True
 
+            if mode == "messages":
+                chunk, metadata = event
+                if (
+                    isinstance(chunk, AIMessageChunk)
+                    and metadata.get("langgraph_node") in TOKEN_STREAMING_NODES
+                    and chunk.text
+                ):
+                    if chunk.id:
+                        streamed_ids.add(chunk.id)
+                    yield _message_event(chunk.text, session_json)
+                continue
+
             # Extract relevant information from the event
             messages = event.get("messages", [])
 
@@ -45,21 +96,12 @@ async def stream_chat_response(
                 last_message = messages[-1]
 
                 # Only stream AI messages
-                if hasattr(last_message, "type"):
-                    message_type = last_message.type
-
-                    if message_type == "ai":
-                        event_data = {
-                            "event": "message",
-                            "data": {
-                                "content": last_message.content,
-                                "type": "ai",
-                                "session_id": session_id,
-                            },
-                        }
-
-                        yield f"data: {json.dumps(event_data)}\n\n"
-                        logger.debug(f"Streamed AI message for session {session_id}")
+                if (
+                    getattr(last_message, "type", None) == "ai"
+                    and last_message.id not in streamed_ids
+                ):
+                    yield _message_event(last_message.content, session_json)
+                    logger.debug("Streamed AI message for session %s", session_id)
 
             # Stream state updates if available
             state_data = {}
@@ -77,7 +119,7 @@ async def stream_chat_response(
                     "event": "state_update",
                     "data": {**state_data, "session_id": session_id},
                 }
-                yield f"data: {json.dumps(state_event)}\n\n"
+                yield _sse_data(state_event)
 
         # Send completion event
         completion_event = {
@@ -87,18 +129,16 @@ async def stream_chat_response(
                 "message": "Stream completed successfully",
             },
         }
-        yield f"data: {json.dumps(completion_event)}\n\n"
+        yield _sse_data(completion_event)
 
-        logger.info(f"Stream completed for session {session_id}")
+        logger.info("Stream completed for session %s", session_id)
 
     except Exception as e:
-        logger.error(
-            f"Error in stream for session {session_id}: {str(e)}", exc_info=True
-        )
+        logger.error("Error in stream for session %s: %s", session_id, e, exc_info=True)
 
         # Send error event
         error_event = {
             "event": "error",
             "data": {"error": str(e), "session_id": session_id},
         }
-        yield f"data: {json.dumps(error_event)}\n\n"
+        yield _sse_data(error_event)
@@ -28,5 +28,8 @@ class Settings(BaseSettings):
 
     GOOGLE_API_KEY: Optional[str] = ""
 
+    # Maximum number of concurrent Places API requests per route
+    ACCOMMODATION_CONCURRENCY_LIMIT: int = 8
+
 
 settings = Settings()
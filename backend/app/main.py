@@ -77,9 +77,9 @@ async def general_exception_handler(request: Request, exc: Exception):
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log all requests."""
-    logger.info(f"{request.method} {request.url.path}")
+    logger.info("%s %s", request.method, request.url.path)
     response = await call_next(request)
-    logger.info(f"Response status: {response.status_code}")
+    logger.info("Response status: %d", response.status_code)
     return response
 
 
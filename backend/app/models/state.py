@@ -1,5 +1,5 @@
 import operator
-from typing import Annotated, List, Optional
+from typing import Annotated, Any, Dict, List, Optional, Tuple
 
 from langchain_core.messages import BaseMessage
 from pydantic import BaseModel, ConfigDict, Field
@@ -59,6 +59,12 @@ class AgentState(BaseModel):
         default=None, description="Daily routes in ascending order."
     )
 
+    # Day numbers whose segment has no accommodation, kept in step with segments
+    days_without_accommodation: List[int] = Field(
+        default_factory=list,
+        description="Days whose endpoint has no accommodation options",
+    )
+
     # Phase 4: User confirmation
     user_confirmed: bool = Field(
         default=False, description="Whether user has confirmed the route overview"
@@ -69,3 +75,48 @@ class AgentState(BaseModel):
 
     # True after first optimization pass
     critical_optimization_done: bool = False
+
+    # True once the optimiser has modified the route since the last user turn
+    route_optimised: bool = False
+
+    @classmethod
+    def from_graph_values(cls, values: Dict[str, Any]) -> "AgentState":
+        """Build a state from checkpointed graph values without revalidating.
+
+        Graph nodes only ever write model instances, so a checkpoint can be
+        trusted as-is. Values holding raw data (e.g. dicts from another
+        source) fall back to full validation.
+
+        Args:
+            values: Channel values from a LangGraph state snapshot
+
+        Returns:
+            AgentState wrapping the given values
+        """
+        segments = values.get("segments")
+        trusted = (
+            isinstance(values.get("requirements"), (RouteRequirements, type(None)))
+            and isinstance(values.get("route"), (Route, type(None)))
+            and (
+                segments is None
+                or all(isinstance(segment, Segment) for segment in segments)
+            )
+        )
+        if not trusted:
+            return cls.model_validate(values)
+        return cls.model_construct(**values)
+
+    @property
+    def routing_view(self) -> Tuple[bool, bool, bool, bool]:
+        """Flags used to pick the graph entry point.
+
+        Returns:
+            Tuple of (has_route, has_requirements, user_confirmed,
+            awaiting_user_response)
+        """
+        return (
+            self.route is not None,
+            self.requirements is not None,
+            self.user_confirmed,
+            self.awaiting_user_response,
+        )
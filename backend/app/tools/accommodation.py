@@ -54,7 +54,9 @@ def search_accommodation_for_day(
     segment = segments[day_number - 1]
 
     logger.info(
-        f"Searching accommodation for day {day_number} with {search_radius_km}km radius"
+        "Searching accommodation for day %d with %skm radius",
+        day_number,
+        search_radius_km,
     )
 
     accommodation = get_accommodation(
@@ -5,12 +5,12 @@ from langchain.tools import ToolRuntime, tool
 from langchain_core.messages import ToolMessage
 from langgraph.types import Command
 
-from app.models import Location
+from app.models import AgentState, Location
 from app.tools.utils import (convert_place_names_to_locations,
                              geocode_location,
                              recalculate_segments_with_accommodation,
                              validate_route_state, validate_segments_state)
-from app.utils import fetch_route
+from app.utils import find_days_without_accommodation, get_cached_route
 
 logger = logging.getLogger(__name__)
 
@@ -55,9 +55,8 @@ def get_route_summary(runtime: ToolRuntime) -> dict:
     route, requirements = validate_route_state(runtime)
     segments = validate_segments_state(runtime)
 
-    days_without_accommodation = [
-        seg.day for seg in segments if len(seg.accommodation_options) == 0
-    ]
+    state: AgentState = runtime.state  # type: ignore
+    days_without_accommodation = state.days_without_accommodation
 
     total_elevation = sum(seg.route.elevation_gain for seg in segments)
 
@@ -96,8 +95,9 @@ def adjust_daily_distance(runtime: ToolRuntime, new_daily_distance_km: int) -> C
     route, requirements = validate_route_state(runtime)
 
     logger.info(
-        f"Adjusting daily distance from {requirements.daily_distance_km}km "
-        f"to {new_daily_distance_km}km"
+        "Adjusting daily distance from %skm to %skm",
+        requirements.daily_distance_km,
+        new_daily_distance_km,
     )
 
     if new_daily_distance_km < 20 or new_daily_distance_km > 200:
@@ -117,6 +117,7 @@ def adjust_daily_distance(runtime: ToolRuntime, new_daily_distance_km: int) -> C
     return Command(
         update={
             "segments": new_segments,
+            "days_without_accommodation": find_days_without_accommodation(new_segments),
             "requirements": updated_requirements,
             "messages": [
                 ToolMessage(
@@ -151,7 +152,7 @@ def add_intermediate_waypoint(
     """
     route, requirements = validate_route_state(runtime)
 
-    logger.info(f"Adding intermediate waypoint: {waypoint_name}")
+    logger.info("Adding intermediate waypoint: %s", waypoint_name)
 
     # Geocode the waypoint
     try:
@@ -174,7 +175,7 @@ def add_intermediate_waypoint(
         new_intermediates.append(waypoint_location)
 
     try:
-        new_route = fetch_route(route.origin, route.destination, new_intermediates)
+        new_route = get_cached_route(route.origin, route.destination, new_intermediates)
     except Exception as e:
         raise ValueError(f"Failed to recalculate route with new waypoint: {str(e)}")
 
@@ -189,13 +190,15 @@ def add_intermediate_waypoint(
     )
 
     logger.info(
-        f"Successfully added waypoint. Route now has {len(new_intermediates)} intermediates"
+        "Successfully added waypoint. Route now has %d intermediates",
+        len(new_intermediates),
     )
 
     return Command(
         update={
             "route": new_route,
             "segments": new_segments,
+            "days_without_accommodation": find_days_without_accommodation(new_segments),
             "requirements": updated_requirements,
             "messages": [
                 ToolMessage(
@@ -231,14 +234,14 @@ def remove_intermediate_waypoint(runtime: ToolRuntime, waypoint_index: int) -> C
         )
 
     removed_waypoint = requirements.intermediates[waypoint_index]
-    logger.info(f"Removing intermediate waypoint: {removed_waypoint.name}")
+    logger.info("Removing intermediate waypoint: %s", removed_waypoint.name)
 
     # Remove waypoint
     new_intermediates = requirements.intermediates.copy()
     new_intermediates.pop(waypoint_index)
 
     try:
-        new_route = fetch_route(route.origin, route.destination, new_intermediates)
+        new_route = get_cached_route(route.origin, route.destination, new_intermediates)
     except Exception as e:
         raise ValueError(f"Failed to recalculate route after removal: {str(e)}")
 
@@ -253,13 +256,15 @@ def remove_intermediate_waypoint(runtime: ToolRuntime, waypoint_index: int) -> C
     )
 
     logger.info(
-        f"Successfully removed waypoint. Route now has {len(new_intermediates)} intermediates"
+        "Successfully removed waypoint. Route now has %d intermediates",
+        len(new_intermediates),
     )
 
     return Command(
         update={
             "route": new_route,
             "segments": new_segments,
+            "days_without_accommodation": find_days_without_accommodation(new_segments),
             "requirements": updated_requirements,
             "messages": [
                 ToolMessage(
@@ -334,7 +339,9 @@ def recalculate_complete_route(
         intermediates = requirements.intermediates
 
     try:
-        new_route = fetch_route(origin_location, destination_location, intermediates)
+        new_route = get_cached_route(
+            origin_location, destination_location, intermediates
+        )
     except Exception as e:
         raise ValueError(f"Failed to calculate new route: {str(e)}")
 
@@ -358,6 +365,7 @@ def recalculate_complete_route(
         update={
             "route": new_route,
             "segments": new_segments,
+            "days_without_accommodation": find_days_without_accommodation(new_segments),
             "requirements": updated_requirements,
             "messages": [
                 ToolMessage(
@@ -49,7 +49,7 @@ def get_segment_details(runtime: ToolRuntime, day_number: int) -> dict:
             "longitude": segment.route.destination.coordinates.longitude,
         },
         "accommodation_count": len(segment.accommodation_options),
-        "has_accommodation": len(segment.accommodation_options) > 0,
+        "has_accommodation": bool(segment.accommodation_options),
         "accommodation_options": [
             acc.model_dump() for acc in segment.accommodation_options
         ],
@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Sequence
 
 import requests
@@ -6,8 +7,11 @@ from langchain.tools import ToolRuntime
 from pydantic_extra_types.coordinate import Coordinate
 
 from app.config import settings
-from app.models import AgentState, Location, Route, RouteRequirements, Segment
-from app.utils import calculate_segments, get_accommodation
+from app.models import (Accommodation, AgentState, Location, Route,
+                        RouteRequirements, Segment)
+from app.utils import (REQUEST_TIMEOUT, geocode_cache,
+                       get_cached_accommodation, get_cached_segments,
+                       http_session)
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +67,25 @@ def validate_segments_state(runtime: ToolRuntime) -> list[Segment]:
 def geocode_location(place_name: str) -> Coordinate:
     """Convert a place name to coordinates using Google Geocoding API.
 
+    Results are cached by normalised place name, so repeated lookups of the
+    same place across sessions don't hit the API again.
+
+    Args:
+        place_name: Name of the place to geocode
+
+    Returns:
+        Coordinate object with latitude and longitude
+
+    Raises:
+        ValueError: If geocoding fails
+    """
+    key = " ".join(place_name.lower().split())
+    return geocode_cache.get_or_set(key, lambda: _request_geocode(place_name))
+
+
+def _request_geocode(place_name: str) -> Coordinate:
+    """Geocode a place name with a request to the Google Geocoding API.
+
     Args:
         place_name: Name of the place to geocode
 
@@ -75,7 +98,11 @@ def geocode_location(place_name: str) -> Coordinate:
     params = {"address": place_name, "key": settings.GOOGLE_API_KEY}
 
     try:
-        response = requests.get(settings.GOOGLE_GEOCODING_API_ENDPOINT, params=params)
+        response = http_session.get(
+            settings.GOOGLE_GEOCODING_API_ENDPOINT,
+            params=params,
+            timeout=REQUEST_TIMEOUT,
+        )
         response.raise_for_status()
 
         data = response.json()
@@ -133,24 +160,30 @@ def recalculate_segments_with_accommodation(
     Returns:
         List of segments with accommodation options
     """
-    logger.info(f"Calculating segments with {daily_distance_km}km daily distance")
+    logger.info("Calculating segments with %skm daily distance", daily_distance_km)
 
     # Calculate segments based on daily distance
-    segments = calculate_segments(
+    segments = get_cached_segments(
         route.polyline, daily_distance_km * 1000, route.origin, route.destination
     )
 
-    # Find accommodation for each segment endpoint
-    for segment in segments:
-        logger.debug(f"Searching accommodation for day {segment.day}")
+    def find_options(segment: Segment) -> list[Accommodation]:
+        logger.debug("Searching accommodation for day %d", segment.day)
         try:
-            accommodation_options = get_accommodation(
+            return get_cached_accommodation(
                 segment.route.destination.coordinates, radius=accommodation_radius_km
             )
-            segment.accommodation_options = accommodation_options
         except Exception as e:
             logger.error(f"Failed to find accommodation for day {segment.day}: {e}")
-            segment.accommodation_options = []
+            return []
+
+    # Search every segment endpoint concurrently, then assign results in order
+    max_workers = max(1, min(len(segments), settings.ACCOMMODATION_CONCURRENCY_LIMIT))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(find_options, segments))
+
+    for segment, accommodation_options in zip(segments, results):
+        segment.accommodation_options = accommodation_options
 
-    logger.info(f"Generated {len(segments)} segments with accommodation data")
+    logger.info("Generated %d segments with accommodation data", len(segments))
     return segments
@@ -1,2 +1,7 @@
-from .utils import (calculate_segments, fetch_route, get_accommodation,
+from .cache import (TTLCache, accommodation_cache, geocode_cache,
+                    get_cached_accommodation, get_cached_route,
+                    get_cached_segments, route_cache, segments_cache)
+from .http import REQUEST_TIMEOUT, http_session
+from .utils import (calculate_segments, fetch_route,
+                    find_days_without_accommodation, get_accommodation,
                     get_elevation_gain)
@@ -0,0 +1,200 @@
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Tuple, TypeVar
+
+from pydantic_extra_types.coordinate import Coordinate
+
+from app.models import Accommodation, Location, Route, Segment
+from app.utils.utils import calculate_segments, fetch_route, get_accommodation
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Decimal places kept when keying coordinate lookups (~11m)
+COORDINATE_PRECISION = 4
+
+# Seconds before a cached external lookup is fetched again
+LOOKUP_CACHE_TTL = 24 * 60 * 60
+
+ACCOMMODATION_CACHE_SIZE = 4096
+GEOCODE_CACHE_SIZE = 1024
+ROUTE_CACHE_SIZE = 256
+SEGMENTS_CACHE_SIZE = 256
+
+
+class TTLCache(Generic[T]):
+    """Thread-safe LRU cache whose entries expire after a fixed time.
+
+    Hits and misses are counted so callers can report how many external
+    requests the cache saved.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, T]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """Return the cached value for key, calling factory on a miss.
+
+        The factory runs outside the lock, so concurrent misses for the same
+        key may both fetch; the last result wins. Exceptions from the factory
+        propagate and nothing is cached.
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = factory()
+
+        with self._lock:
+            self._entries[key] = (now + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def log_stats(self) -> None:
+        """Log how many lookups the cache has served without a request."""
+        logger.info(
+            "%s cache: %d hits, %d misses (%d requests saved)",
+            self.name,
+            self.hits,
+            self.misses,
+            self.hits,
+        )
+
+
+accommodation_cache: TTLCache[Tuple[Accommodation, ...]] = TTLCache(
+    "Accommodation", ACCOMMODATION_CACHE_SIZE, LOOKUP_CACHE_TTL
+)
+
+geocode_cache: TTLCache[Coordinate] = TTLCache(
+    "Geocode", GEOCODE_CACHE_SIZE, LOOKUP_CACHE_TTL
+)
+
+route_cache: TTLCache[Route] = TTLCache("Route", ROUTE_CACHE_SIZE, LOOKUP_CACHE_TTL)
+
+segments_cache: TTLCache[Tuple[Segment, ...]] = TTLCache(
+    "Segments", SEGMENTS_CACHE_SIZE, LOOKUP_CACHE_TTL
+)
+
+
+def get_cached_accommodation(
+    location: Coordinate, radius: int = 5
+) -> list[Accommodation]:
+    """Find accommodation near a location, reusing recent nearby lookups.
+
+    Coordinates are rounded to COORDINATE_PRECISION so points a few metres
+    apart share an entry.
+
+    Args:
+        location: The location to search near
+        radius: Radius, in km, around which to search
+
+    Returns:
+        A new list of accommodation options
+    """
+    lat = round(location.latitude, COORDINATE_PRECISION)
+    lng = round(location.longitude, COORDINATE_PRECISION)
+
+    options = accommodation_cache.get_or_set(
+        (lat, lng, radius),
+        lambda: tuple(
+            get_accommodation(Coordinate(latitude=lat, longitude=lng), radius=radius)
+        ),
+    )
+    return list(options)
+
+
+def get_cached_route(
+    origin: Location,
+    destination: Location,
+    intermediates: list[Location] = [],
+) -> Route:
+    """Calculate a route, reusing a recent route between the same points.
+
+    The key is the rounded coordinates of every stop in order, so renaming a
+    location does not force a new Routes API request. The returned route
+    always carries the caller's origin and destination.
+
+    Args:
+        origin: The starting location
+        destination: The final location
+        intermediates: Locations the route must pass through in ascending order
+
+    Returns:
+        Route between the given locations
+    """
+    key = tuple(
+        (
+            round(loc.coordinates.latitude, COORDINATE_PRECISION),
+            round(loc.coordinates.longitude, COORDINATE_PRECISION),
+        )
+        for loc in (origin, *intermediates, destination)
+    )
+
+    route = route_cache.get_or_set(
+        key, lambda: fetch_route(origin, destination, intermediates)
+    )
+    return route.model_copy(update={"origin": origin, "destination": destination})
+
+
+def get_cached_segments(
+    route_polyline: str,
+    daily_distance: int,
+    route_origin: Location,
+    route_destination: Location,
+) -> list[Segment]:
+    """Split a route into daily segments, reusing a recent identical split.
+
+    Segments are mutated downstream (accommodation is attached to them), so
+    callers always receive a deep copy of the cached result.
+
+    Args:
+        route_polyline: Encoded polyline of the overall route
+        daily_distance: Target distance per day in meters
+        route_origin: Origin location of the overall route
+        route_destination: Destination location of the overall route
+
+    Returns:
+        A new list of segments with route details for each day
+    """
+    key = (
+        route_polyline,
+        daily_distance,
+        route_origin.model_dump_json(),
+        route_destination.model_dump_json(),
+    )
+
+    segments = segments_cache.get_or_set(
+        key,
+        lambda: tuple(
+            calculate_segments(
+                route_polyline, daily_distance, route_origin, route_destination
+            )
+        ),
+    )
+    return copy.deepcopy(list(segments))
@@ -0,0 +1,39 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connections kept open per host; covers the concurrent accommodation lookups
+POOL_MAXSIZE = 20
+
+# (connect, read) timeout in seconds for Google API requests
+REQUEST_TIMEOUT = (3.05, 10)
+
+# Retries for connection errors and transient Google API failures. Status
+# retries keep urllib3's idempotent method set, so billable POSTs to the
+# Routes and Places APIs are never resent on an error response
+MAX_RETRIES = Retry(
+    total=2,
+    backoff_factor=0.2,
+    status_forcelist=(429, 500, 502, 503, 504),
+    raise_on_status=False,
+)
+
+
+def create_http_session() -> requests.Session:
+    """Create a pooled HTTP session for Google API requests.
+
+    Reusing one session keeps TLS connections to the Google endpoints open,
+    so repeated Routes, Places and Geocoding calls skip the handshake.
+
+    Returns:
+        Session with a connection pool and retries mounted for HTTPS
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10, pool_maxsize=POOL_MAXSIZE, max_retries=MAX_RETRIES
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+http_session = create_http_session()
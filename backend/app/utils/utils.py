@@ -1,16 +1,39 @@
 import logging
 import random
 
+import numpy as np
 import polyline
 import requests
-from geopy.distance import geodesic
+from numpy.typing import ArrayLike
 from pydantic_extra_types.coordinate import Coordinate
 
 from app.config import settings
 from app.models import Accommodation, Location, Route, Segment
+from app.utils.http import REQUEST_TIMEOUT, http_session
 
 logger = logging.getLogger(__name__)
 
+# WGS84 equatorial radius and squared eccentricity used for edge distances
+EARTH_EQUATORIAL_RADIUS_KM = 6378.137
+EARTH_ECCENTRICITY_SQ = (1 / 298.257223563) * (2 - 1 / 298.257223563)
+
+# Routes API travel settings, tried in order until one finds a route
+ROUTING_STRATEGIES = (
+    {
+        "travelMode": "BICYCLE",
+        # No routingPreference allowed for BICYCLE
+    },
+    {
+        "travelMode": "DRIVE",
+        "routingPreference": "TRAFFIC_UNAWARE",
+        "routeModifiers": {"avoidHighways": True, "avoidFerries": True},
+    },
+)
+
+ROUTES_FIELD_MASK = (
+    "routes.duration,routes.distanceMeters,routes.polyline.encodedPolyline"
+)
+
 
 def get_elevation_gain(polyline: str) -> int:
     """Calculate the elevation gain for a polyline route
@@ -46,7 +69,11 @@ def reverse_geocode(coordinates: Coordinate) -> str:
     }
 
     try:
-        response = requests.get(settings.GOOGLE_GEOCODING_API_ENDPOINT, params=params)
+        response = http_session.get(
+            settings.GOOGLE_GEOCODING_API_ENDPOINT,
+            params=params,
+            timeout=REQUEST_TIMEOUT,
+        )
         response.raise_for_status()
 
         data = response.json()
@@ -127,8 +154,11 @@ def get_accommodation(location: Coordinate, radius: int = 5) -> list[Accommodati
     }
 
     try:
-        response = requests.post(
-            settings.GOOGLE_PLACES_API_ENDPOINT, json=request_body, headers=headers
+        response = http_session.post(
+            settings.GOOGLE_PLACES_API_ENDPOINT,
+            json=request_body,
+            headers=headers,
+            timeout=REQUEST_TIMEOUT,
         )
         response.raise_for_status()
         data = response.json()
@@ -169,32 +199,19 @@ def fetch_route(
     Raises:
         ValueError: If route calculation fails
     """
-    routing_strategies = [
+    intermediates_request = [
         {
-            "travelMode": "BICYCLE",
-            # No routingPreference allowed for BICYCLE
-        },
-        {
-            "travelMode": "DRIVE",
-            "routingPreference": "TRAFFIC_UNAWARE",
-            "routeModifiers": {"avoidHighways": True, "avoidFerries": True},
-        },
+            "via": True,
+            "location": {
+                "latLng": {
+                    "latitude": loc.coordinates.latitude,
+                    "longitude": loc.coordinates.longitude,
+                }
+            },
+        }
+        for loc in intermediates
     ]
 
-    intermediates_request = []
-    for loc in intermediates:
-        intermediates_request.append(
-            {
-                "via": True,
-                "location": {
-                    "latLng": {
-                        "latitude": loc.coordinates.latitude,
-                        "longitude": loc.coordinates.longitude,
-                    }
-                },
-            }
-        )
-
     base_request = {
         "origin": {
             "location": {
@@ -221,17 +238,20 @@ def fetch_route(
     headers = {
         "Content-Type": "application/json",
         "X-Goog-Api-Key": settings.GOOGLE_API_KEY,
-        "X-Goog-FieldMask": "routes.duration,routes.distanceMeters,routes.polyline.encodedPolyline",
+        "X-Goog-FieldMask": ROUTES_FIELD_MASK,
     }
 
     last_error = None
-    for strategy in routing_strategies:
+    for strategy in ROUTING_STRATEGIES:
         # Merge the base request with the current strategy settings
         request_body = base_request | strategy
 
         try:
-            response = requests.post(
-                settings.GOOGLE_ROUTES_API_ENDPOINT, json=request_body, headers=headers
+            response = http_session.post(
+                settings.GOOGLE_ROUTES_API_ENDPOINT,
+                json=request_body,
+                headers=headers,
+                timeout=REQUEST_TIMEOUT,
             )
             response.raise_for_status()
 
@@ -239,8 +259,9 @@ def fetch_route(
 
             # If 'routes' is missing, this strategy failed to find a path
             if not data or "routes" not in data:
-                print(
-                    f"Warning: No route found for {strategy['travelMode']}. Attempting fallback..."
+                logger.warning(
+                    "No route found for %s. Attempting fallback...",
+                    strategy["travelMode"],
                 )
                 continue
 
@@ -257,7 +278,7 @@ def fetch_route(
 
         except Exception as e:
             last_error = e
-            print(f"Error requesting {strategy['travelMode']}: {e}")
+            logger.error("Error requesting %s: %s", strategy["travelMode"], e)
             # Continue to next strategy
 
     raise ValueError(
@@ -265,6 +286,79 @@ def fetch_route(
     )
 
 
+def find_days_without_accommodation(segments: list[Segment]) -> list[int]:
+    """Return the day numbers of segments with no accommodation options."""
+    return [seg.day for seg in segments if not seg.accommodation_options]
+
+
+def decode_polyline(expression: str, precision: int = 5) -> np.ndarray:
+    """Decode an encoded polyline into an array of (lat, lng) points.
+
+    Vectorised equivalent of polyline.decode. The character loop becomes a
+    few array operations, which matters for long multi-day routes.
+
+    Args:
+        expression: Encoded polyline string
+        precision: Decimal places encoded in the polyline (5 for Google)
+
+    Returns:
+        Array of shape (N, 2) with coordinates in degrees
+
+    Raises:
+        ValueError: If the polyline does not hold whole (lat, lng) pairs
+    """
+    if not expression:
+        return np.empty((0, 2))
+
+    chunks = np.frombuffer(expression.encode("ascii"), dtype=np.uint8) - 63
+    chunks = chunks.astype(np.int64)
+
+    # Each value is a run of 5-bit chunks, the last of which has no
+    # continuation bit (0x20) set
+    is_last = chunks < 0x20
+    starts = np.flatnonzero(np.concatenate(([True], is_last[:-1])))
+    lengths = np.diff(np.append(starts, len(chunks)))
+    position = np.arange(len(chunks)) - np.repeat(starts, lengths)
+    values = np.add.reduceat((chunks & 0x1F) << (5 * position), starts)
+
+    if len(values) % 2:
+        raise ValueError("Invalid polyline: incomplete coordinate pair")
+
+    # Undo the zigzag sign encoding, then sum the deltas into positions
+    deltas = np.where(values & 1, ~(values >> 1), values >> 1)
+    return np.cumsum(deltas.reshape(-1, 2), axis=0) / 10**precision
+
+
+def edge_distances_km(coordinates: ArrayLike) -> np.ndarray:
+    """Length of every edge of a decoded polyline.
+
+    Uses the "cheap ruler" local planar approximation: each edge is scaled by
+    the WGS84 metres-per-degree at its mid latitude, so one cosine per edge
+    replaces the haversine trigonometry. Polyline edges are short, which
+    keeps the error well under 0.1% of the ellipsoidal distance.
+
+    Args:
+        coordinates: (lat, lng) points in degrees, in route order, shape (N, 2)
+
+    Returns:
+        Array of len(coordinates) - 1 edge lengths in km
+    """
+    points = np.asarray(coordinates, dtype=np.float64)
+    lat, lng = points[:, 0], points[:, 1]
+
+    # km per degree of longitude (kx) and latitude (ky) at each edge's midpoint
+    cos_lat = np.cos(np.radians((lat[:-1] + lat[1:]) / 2))
+    w2 = 1 / (1 - EARTH_ECCENTRICITY_SQ * (1 - cos_lat**2))
+    w = np.sqrt(w2)
+    km_per_degree = np.radians(EARTH_EQUATORIAL_RADIUS_KM)
+    kx = km_per_degree * w * cos_lat
+    ky = km_per_degree * w * w2 * (1 - EARTH_ECCENTRICITY_SQ)
+
+    # Wrap longitude deltas so edges crossing the antimeridian stay short
+    d_lng = (np.diff(lng) + 180) % 360 - 180
+    return np.hypot(d_lng * kx, np.diff(lat) * ky)
+
+
 def calculate_segments(
     route_polyline: str,
     daily_distance: int,
@@ -283,6 +377,9 @@ def calculate_segments(
     - Last segment destination: Uses the route destination name
     - Intermediate endpoints: Uses reverse geocoding to find the nearest place name
 
+    Each segment starts where the previous one ended, so only segment
+    destinations need reverse geocoding.
+
     Args:
         route_polyline: Encoded polyline string from Google Routes API
         daily_distance: Target distance per day in meters
@@ -293,104 +390,56 @@ def calculate_segments(
         List of segments with route details for each day
 
     """
-    # Decode the polyline into (lat, lng) tuples
-    coordinates = polyline.decode(route_polyline)
+    # Decode the polyline into an (N, 2) array of (lat, lng) points
+    coordinates = np.asarray(decode_polyline(route_polyline), dtype=np.float64)
 
-    if not coordinates or len(coordinates) < 2:
+    if len(coordinates) < 2:
         raise ValueError("Invalid polyline: must contain at least 2 points")
 
+    # Cumulative distance (km) at the end of each edge
+    cumulative = np.cumsum(edge_distances_km(coordinates))
+    last_edge = len(cumulative) - 1
+    daily_km = daily_distance / 1000
+
+    # Find the edge on which each day ends: the first edge whose cumulative
+    # distance reaches the day's target, and always after the previous split
+    split_edges = []
+    target = daily_km
+    previous = -1
+    while True:
+        edge = max(int(np.searchsorted(cumulative, target)), previous + 1)
+        if edge > last_edge:
+            break
+        split_edges.append(edge)
+        previous = edge
+        target += daily_km
+
+    # A route ending exactly on a split has no final partial day
+    if not split_edges or split_edges[-1] < last_edge:
+        split_edges.append(last_edge)
+
     segments = []
-    cumulative_distance = 0.0
-    target_distance = daily_distance / 1000  # convert to km
-    day_number = 1
-    segment_start_idx = 0
-    segment_distance = 0.0
-
-    # Iterate through the polyline segments
-    for i in range(len(coordinates) - 1):
-        point1 = coordinates[i]
-        point2 = coordinates[i + 1]
-
-        # Calculate distance of this edge
-        edge_distance = geodesic(point1, point2).kilometers
-        cumulative_distance += edge_distance
-        segment_distance += edge_distance
-
-        # Check if we've reached or passed the target distance for this day
-        if cumulative_distance >= target_distance:
-            # Create segment from segment_start_idx to current point (i+1)
-            segment_coords = coordinates[segment_start_idx : i + 2]
-            segment_polyline = polyline.encode(segment_coords)
-
-            # Determine origin location for this segment
-            if segment_start_idx == 0:
-                # First segment uses the route origin
-                segment_origin = route_origin
-            else:
-                # Intermediate segments: reverse geocode to get place name
-                origin_coord = Coordinate(
-                    latitude=coordinates[segment_start_idx][0],  # type: ignore
-                    longitude=coordinates[segment_start_idx][1],  # type: ignore
-                )
-                origin_name = reverse_geocode(origin_coord)
-                segment_origin = Location(
-                    name=origin_name,
-                    coordinates=origin_coord,
-                )
+    segment_origin = route_origin
+    start_edge = 0
+
+    for day_number, end_edge in enumerate(split_edges, start=1):
+        segment_coords = coordinates[start_edge : end_edge + 2]
+        segment_polyline = polyline.encode(segment_coords.tolist())
 
-            # Determine destination location for this segment
+        if end_edge == last_edge:
+            # Final segment always uses the route destination
+            segment_destination = route_destination
+        else:
             # Use reverse geocoding to get the place name
-            dest_coord = Coordinate(
-                latitude=point2[0],  # type: ignore
-                longitude=point2[1],  # type: ignore
-            )
-            dest_name = reverse_geocode(dest_coord)
+            end_lat, end_lng = coordinates[end_edge + 1].tolist()
+            dest_coord = Coordinate(latitude=end_lat, longitude=end_lng)
             segment_destination = Location(
-                name=dest_name,
+                name=reverse_geocode(dest_coord),
                 coordinates=dest_coord,
             )
 
-            route = Route(
-                polyline=segment_polyline,
-                origin=segment_origin,
-                destination=segment_destination,
-                distance=int(segment_distance * 1000),  # convert to meters
-                elevation_gain=get_elevation_gain(segment_polyline),
-            )
-
-            segment = Segment(day=day_number, route=route, accommodation_options=[])
-
-            segments.append(segment)
-
-            # Reset for next segment
-            segment_start_idx = i + 1
-            segment_distance = 0.0
-            day_number += 1
-            target_distance += daily_distance / 1000
-
-    # Handle the final segment (from last split point to destination)
-    if segment_start_idx < len(coordinates) - 1:
-        segment_coords = coordinates[segment_start_idx:]
-        segment_polyline = polyline.encode(segment_coords)
-
-        # Determine origin for final segment
-        if segment_start_idx == 0:
-            # Only one segment - use route origin
-            segment_origin = route_origin
-        else:
-            # Multiple segments - reverse geocode the starting point
-            origin_coord = Coordinate(
-                latitude=coordinates[segment_start_idx][0],  # type: ignore
-                longitude=coordinates[segment_start_idx][1],  # type: ignore
-            )
-            origin_name = reverse_geocode(origin_coord)
-            segment_origin = Location(
-                name=origin_name,
-                coordinates=origin_coord,
-            )
-
-        # Final segment always uses the route destination
-        segment_destination = route_destination
+        start_distance = cumulative[start_edge - 1] if start_edge else 0.0
+        segment_distance = cumulative[end_edge] - start_distance
 
         route = Route(
             polyline=segment_polyline,
@@ -400,16 +449,14 @@ def calculate_segments(
             elevation_gain=get_elevation_gain(segment_polyline),
         )
 
-        segment = Segment(day=day_number, route=route, accommodation_options=[])
-
-        segments.append(segment)
+        segments.append(Segment(day=day_number, route=route, accommodation_options=[]))
 
-    # Update intermediate segments so each segment's origin matches the previous segment's destination
-    if len(segments) > 1:
-        for i in range(len(segments) - 1):
-            # Make the next segment's origin use the same Location object as this segment's destination
-            segments[i + 1].route.origin = segments[i].route.destination
+        # The next segment starts at this segment's destination
+        segment_origin = segment_destination
+        start_edge = end_edge + 1
 
-    logger.info(f"Generated {len(segments)} segments with reverse-geocoded place names")
+    logger.info(
+        "Generated %d segments with reverse-geocoded place names", len(segments)
+    )
 
     return segments
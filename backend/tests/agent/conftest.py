@@ -0,0 +1,60 @@
+import pytest
+
+from app.models import Accommodation, Route, RouteRequirements, Segment
+
+
+@pytest.fixture
+def mock_two_day_route(mock_origin, mock_destination):
+    """Fixture providing the overall route covered by mock_segments"""
+    return Route(
+        polyline="test_polyline_string",
+        origin=mock_origin,
+        destination=mock_destination,
+        distance=80500,
+        elevation_gain=370,
+    )
+
+
+@pytest.fixture
+def mock_segments(mock_origin, mock_destination, mock_intermediate):
+    """Fixture providing two days of segments, the second without accommodation"""
+    return [
+        Segment(
+            day=1,
+            route=Route(
+                polyline="day_one",
+                origin=mock_origin,
+                destination=mock_intermediate,
+                distance=42000,
+                elevation_gain=250,
+            ),
+            accommodation_options=[
+                Accommodation(
+                    name="Test Hotel",
+                    address="123 Test St, Wetherby",
+                    map_link="https://maps.google.com/place/test",
+                    rating=4.5,
+                )
+            ],
+        ),
+        Segment(
+            day=2,
+            route=Route(
+                polyline="day_two",
+                origin=mock_intermediate,
+                destination=mock_destination,
+                distance=38500,
+                elevation_gain=120,
+            ),
+        ),
+    ]
+
+
+@pytest.fixture
+def mock_requirements(mock_origin, mock_destination):
+    """Fixture providing test route requirements"""
+    return RouteRequirements(
+        origin=mock_origin,
+        destination=mock_destination,
+        daily_distance_km=40,
+    )
@@ -0,0 +1,110 @@
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from app.agent.config import (build_system_block, create_llm_with_tools,
+                              trim_history, with_history_breakpoint)
+from app.models import RouteRequirements
+from app.tools import get_location, get_weather
+
+
+def test_build_system_block_marks_prompt_cacheable():
+    """Test that the static prompt is emitted as a cacheable block"""
+    blocks = build_system_block("Static instructions")
+
+    assert blocks == [
+        {
+            "type": "text",
+            "text": "Static instructions",
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+
+
+def test_build_system_block_appends_uncached_context():
+    """Test that dynamic context follows the cached prompt without cache_control"""
+    blocks = build_system_block("Static instructions", "Route data")
+
+    assert len(blocks) == 2
+    assert blocks[0]["cache_control"] == {"type": "ephemeral"}
+    assert blocks[1] == {"type": "text", "text": "Route data"}
+
+
+def test_create_llm_with_tools_reuses_bound_llm(monkeypatch):
+    """Test that the same tool set returns the cached bound LLM"""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test_api_key")
+
+    first = create_llm_with_tools([get_location, RouteRequirements])
+    second = create_llm_with_tools([get_location, RouteRequirements])
+    other = create_llm_with_tools([get_weather])
+
+    assert first is second
+    assert other is not first
+    assert other.bound is first.bound
+
+
+def test_writer_uses_shared_llm(monkeypatch):
+    """Test that the writer reuses the client the tool bindings wrap"""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test_api_key")
+    from app.agent.nodes.writer import _get_llm
+
+    bound = create_llm_with_tools([get_weather])
+
+    assert _get_llm() is bound.bound
+
+
+def test_with_history_breakpoint_marks_last_message():
+    """Test that the last history message gets a cache breakpoint on a copy"""
+    history = [HumanMessage(content="Leeds to York"), AIMessage(content="How far?")]
+
+    marked = with_history_breakpoint(history)
+
+    assert marked[0] is history[0]
+    assert marked[-1].content == [
+        {"type": "text", "text": "How far?", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert history[-1].content == "How far?"
+
+
+def test_with_history_breakpoint_skips_empty_content():
+    """Test that a message without text content is sent unchanged"""
+    history = [AIMessage(content="")]
+
+    assert with_history_breakpoint(history) == history
+
+
+def test_trim_history_keeps_short_history_whole():
+    """Test that a history within budget is sent unchanged"""
+    history = [HumanMessage(content="Leeds to York"), AIMessage(content="How far?")]
+
+    assert trim_history(history) == history
+
+
+def test_trim_history_starts_on_human_message(monkeypatch):
+    """Test that trimming never leaves a tool result without its call"""
+    monkeypatch.setattr("app.agent.config.llm.MAX_HISTORY_TOKENS", 200)
+    history = [
+        HumanMessage(content="x" * 2000),
+        AIMessage(
+            content="", tool_calls=[{"name": "get_location", "args": {}, "id": "1"}]
+        ),
+        ToolMessage(content="y" * 200, tool_call_id="1"),
+        AIMessage(content="Where next?"),
+        HumanMessage(content="York"),
+    ]
+
+    assert trim_history(history) == history[-1:]
+
+
+def test_trim_history_truncates_oversized_latest_turn(monkeypatch):
+    """Test that a latest turn over budget is cut down rather than sent whole"""
+    monkeypatch.setattr("app.agent.config.llm.MAX_HISTORY_TOKENS", 50)
+    history = [
+        HumanMessage(content="Leeds to York"),
+        AIMessage(content="How far each day?"),
+        HumanMessage(content="z" * 1000),
+    ]
+
+    trimmed = trim_history(history)
+
+    assert len(trimmed) == 1
+    assert trimmed[0].content == "z" * 200
+    assert history[-1].content == "z" * 1000
@@ -0,0 +1,152 @@
+from unittest.mock import Mock, patch
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from app.agent.nodes.optimiser import (_OPTIMISATION_TOOL_NAMES,
+                                       _READ_ONLY_TOOL_NAMES, optimiser_node)
+from app.models import AgentState
+from app.tools import OPTIMISATION_TOOLS
+
+
+def _state(messages, route_optimised, route, segments, requirements):
+    return AgentState(
+        messages=messages,
+        route=route,
+        segments=segments,
+        requirements=requirements,
+        route_optimised=route_optimised,
+    )
+
+
+def test_optimisation_tool_names_are_real_tools():
+    """Test that every tracked tool name belongs to an optimiser tool"""
+    tool_names = {tool.name for tool in OPTIMISATION_TOOLS}
+
+    assert _READ_ONLY_TOOL_NAMES <= tool_names
+    assert _OPTIMISATION_TOOL_NAMES == tool_names - _READ_ONLY_TOOL_NAMES
+    assert "add_intermediate_waypoint" in _OPTIMISATION_TOOL_NAMES
+
+
+@patch("app.agent.nodes.optimiser._get_llm")
+def test_optimiser_node_flags_route_changes(
+    mock_get_llm, mock_route, mock_segments, mock_requirements
+):
+    """Test that calling a route-changing tool marks the route as optimised"""
+    response = AIMessage(
+        content="",
+        tool_calls=[{"name": "adjust_daily_distance", "args": {}, "id": "call_1"}],
+    )
+    mock_get_llm.return_value = Mock(invoke=Mock(return_value=response))
+    state = _state(
+        [HumanMessage(content="Shorter days please")],
+        False,
+        mock_route,
+        mock_segments,
+        mock_requirements,
+    )
+
+    result = optimiser_node(state)
+
+    assert result.goto == "optimiser_tools"
+    assert result.update["route_optimised"] is True
+
+
+@patch("app.agent.nodes.optimiser._get_llm")
+def test_optimiser_node_skips_reoptimising_within_turn(
+    mock_get_llm, mock_route, mock_segments, mock_requirements
+):
+    """Test that an optimised route is not changed again before user feedback"""
+    mock_llm = Mock(invoke=Mock(return_value=AIMessage(content="Done")))
+    mock_get_llm.return_value = mock_llm
+    state = _state(
+        [ToolMessage(content="New daily distance set.", tool_call_id="call_1")],
+        True,
+        mock_route,
+        mock_segments,
+        mock_requirements,
+    )
+
+    result = optimiser_node(state)
+
+    request = mock_llm.invoke.call_args.args[0][-1]
+    assert "Route already optimized" in request.content
+    assert result.goto == "reviewer"
+    assert result.update["route_optimised"] is True
+    assert result.update["critical_optimization_done"] is True
+
+
+@patch("app.agent.nodes.optimiser._get_llm")
+def test_optimiser_node_skips_llm_without_critical_issues(
+    mock_get_llm, mock_route, mock_segments, mock_requirements
+):
+    """Test that a first pass with nothing to fix goes straight to the reviewer"""
+    state = _state(
+        [ToolMessage(content="Route requirements validated.", tool_call_id="call_1")],
+        False,
+        mock_route,
+        mock_segments,
+        mock_requirements,
+    )
+
+    result = optimiser_node(state)
+
+    mock_get_llm.assert_not_called()
+    assert result.goto == "reviewer"
+    assert "messages" not in result.update
+    assert result.update["critical_optimization_done"] is True
+
+
+@patch("app.agent.nodes.optimiser._get_llm")
+def test_optimiser_node_returns_tool_results_to_llm(
+    mock_get_llm, mock_route, mock_segments, mock_requirements
+):
+    """Test that results from a read-only tool are not skipped on a first pass"""
+    mock_llm = Mock(invoke=Mock(return_value=AIMessage(content="All good")))
+    mock_get_llm.return_value = mock_llm
+    state = _state(
+        [
+            AIMessage(
+                content="",
+                tool_calls=[
+                    {"name": "get_segment_details", "args": {}, "id": "call_2"}
+                ],
+            ),
+            ToolMessage(
+                content="Day 1 details",
+                tool_call_id="call_2",
+                name="get_segment_details",
+            ),
+        ],
+        False,
+        mock_route,
+        mock_segments,
+        mock_requirements,
+    )
+
+    result = optimiser_node(state)
+
+    mock_llm.invoke.assert_called_once()
+    assert result.goto == "reviewer"
+    assert result.update["critical_optimization_done"] is True
+
+
+@patch("app.agent.nodes.optimiser._get_llm")
+def test_optimiser_node_calls_llm_for_missing_accommodation(
+    mock_get_llm, mock_route, mock_segments, mock_requirements
+):
+    """Test that a day without accommodation still gets an optimisation pass"""
+    mock_llm = Mock(invoke=Mock(return_value=AIMessage(content="Fixed")))
+    mock_get_llm.return_value = mock_llm
+    state = _state(
+        [ToolMessage(content="Route requirements validated.", tool_call_id="call_1")],
+        False,
+        mock_route,
+        mock_segments,
+        mock_requirements,
+    )
+    state.days_without_accommodation = [2]
+
+    optimiser_node(state)
+
+    request = mock_llm.invoke.call_args.args[0][-1]
+    assert "Days without accommodation: 2" in request.content
@@ -0,0 +1,28 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph import END
+
+from app.agent.nodes.planner import planner_node
+from app.models import AgentState
+
+
+@pytest.mark.parametrize(
+    "tool_calls, expected",
+    [
+        ([], END),
+        ([{"name": "get_location", "args": {}, "id": "call_1"}], "planner_tools"),
+        ([{"name": "RouteRequirements", "args": {}, "id": "call_1"}], "parser"),
+    ],
+)
+@patch("app.agent.nodes.planner._get_llm")
+def test_planner_node_routes_on_tool_calls(mock_get_llm, tool_calls, expected):
+    """Test that the planner picks its next node from the response tool calls"""
+    response = AIMessage(content="", tool_calls=tool_calls)
+    mock_get_llm.return_value = Mock(invoke=Mock(return_value=response))
+
+    result = planner_node(AgentState(messages=[HumanMessage(content="Leeds to York")]))
+
+    assert result.goto == expected
+    assert result.update["messages"] == [response]
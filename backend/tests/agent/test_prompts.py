@@ -0,0 +1,67 @@
+import hashlib
+
+import pytest
+
+from app.agent.config import (format_confirmation_message,
+                              format_itinerary_route_data,
+                              format_segments_table, prompts)
+
+# SHA-256 fingerprints of the static prompts. Anthropic's prompt cache is
+# keyed on the exact prefix, so any edit invalidates cached prompts - update
+# these deliberately when a prompt is changed on purpose.
+PROMPT_FINGERPRINTS = {
+    "PLANNER_SYSTEM_PROMPT": "c3afc5a646be4e351b32f4ea9e47a5f8775b6cb3a48f580d41c1ff9566f382be",
+    "OPTIMISER_SYSTEM_PROMPT": "61441501e27f9ae2c5ff571f13e94cd5bc7eace70d0c54a14f0f9d4e415c05b7",
+    "OPTIMISER_MODE_INITIAL": "e5d829e4bce0f19899a5c77353586694a2a16d65c0b37c7275d715e4e5fd3025",
+    "OPTIMISER_MODE_FEEDBACK": "7b5720c818f174538dbe01b1785e9317c1a674f23af9eb7411e68df44888c040",
+    "REVIEWER_INITIAL_PROMPT": "4d7e418fd13fc1ecf0c65902db0f4f2a60ed481d987f355a99334c58f11b5456",
+    "REVIEWER_RESPONSE_PROMPT": "aa1c05cd82742215b8689e375f8c8e89976d47cb514454b81e0afa813d709617",
+    "ITINERARY_SYSTEM_PROMPT": "789944e2e697ca0482df3f9a26c40c2a97b4dbfb4961014cf7ccef693f394585",
+}
+
+
+@pytest.mark.parametrize("name,fingerprint", PROMPT_FINGERPRINTS.items())
+def test_prompt_fingerprint_unchanged(name, fingerprint):
+    """Test that static prompts have not drifted from their recorded hash"""
+    prompt = getattr(prompts, name)
+
+    assert hashlib.sha256(prompt.encode()).hexdigest() == fingerprint
+
+
+def test_format_segments_table(mock_segments):
+    """Test that segments render as a header plus one row per day"""
+    result = format_segments_table(mock_segments)
+
+    assert result.splitlines() == [
+        "day|dest|km|elev_m|accommodation",
+        "1|Wetherby|42.0|250|Test Hotel",
+        "2|York|38.5|120|none",
+    ]
+
+
+def test_format_itinerary_route_data(
+    mock_requirements, mock_two_day_route, mock_segments
+):
+    """Test that route data renders the route summary followed by the segment table"""
+    result = format_itinerary_route_data(
+        mock_requirements, mock_two_day_route, mock_segments
+    )
+
+    assert result.startswith("---\nROUTE_DATA:\n")
+    assert "- Origin: Leeds\n" in result
+    assert "- Destination: York\n" in result
+    assert "- Total Distance: 80.50 km\n" in result
+    assert "- Daily Target: 40 km/day\n" in result
+    assert result.endswith(format_segments_table(mock_segments) + "\n")
+
+
+def test_format_confirmation_message(
+    mock_requirements, mock_two_day_route, mock_segments
+):
+    """Test that the confirmation restates the finalised route"""
+    result = format_confirmation_message(
+        mock_requirements, mock_two_day_route, mock_segments
+    )
+
+    assert result.startswith("Your route from Leeds to York is confirmed: ")
+    assert "80.5 km over 2 days." in result
@@ -0,0 +1,119 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from app.agent.config import REVIEWER_INITIAL_BLOCKS, REVIEWER_RESPONSE_BLOCKS
+from app.agent.nodes.reviewer import _check_for_recent_changes, reviewer_node
+from app.models import AgentState
+
+
+def _tool_call_message(*names):
+    return AIMessage(
+        content="",
+        tool_calls=[
+            {"name": name, "args": {}, "id": f"call_{i}"}
+            for i, name in enumerate(names)
+        ],
+    )
+
+
+def test_check_for_recent_changes_reports_in_category_order():
+    """Test that recent tool calls are summarised once each, in a fixed order"""
+    state = AgentState(
+        messages=[
+            HumanMessage(content="Avoid the hills"),
+            _tool_call_message("add_intermediate_waypoint", "get_route_summary"),
+            _tool_call_message("get_route_summary", "confirm_route"),
+        ]
+    )
+
+    assert (
+        _check_for_recent_changes(state)
+        == "Analyzed route summary, Modified route segments"
+    )
+
+
+def test_check_for_recent_changes_ignores_older_messages():
+    """Test that only the last five messages are scanned"""
+    state = AgentState(
+        messages=[
+            _tool_call_message("adjust_daily_distance"),
+            *(HumanMessage(content="ok") for _ in range(5)),
+        ]
+    )
+
+    assert _check_for_recent_changes(state) == ""
+
+
+@patch("app.agent.nodes.reviewer._get_llm")
+def test_reviewer_node_acknowledges_confirmation_without_llm(
+    mock_get_llm, mock_route, mock_segments, mock_requirements
+):
+    """Test that a confirmed route is acknowledged from a template"""
+    state = AgentState(
+        messages=[HumanMessage(content="Looks good")],
+        route=mock_route,
+        segments=mock_segments,
+        requirements=mock_requirements,
+        user_confirmed=True,
+    )
+
+    result = asyncio.run(reviewer_node(state))
+
+    mock_get_llm.assert_not_called()
+    assert result.goto == "writer"
+    assert "is confirmed" in result.update["messages"][0].content
+
+
+def _reviewer_llm():
+    return Mock(ainvoke=AsyncMock(return_value=AIMessage(content="Overview")))
+
+
+@patch("app.agent.nodes.reviewer._get_llm")
+def test_reviewer_node_gives_initial_overview_after_planning(
+    mock_get_llm, mock_route, mock_segments, mock_requirements
+):
+    """Test that the turn which built the route gets the initial overview"""
+    mock_get_llm.return_value = _reviewer_llm()
+    state = AgentState(
+        messages=[
+            HumanMessage(content="Leeds to York, 40km a day"),
+            _tool_call_message("RouteRequirements"),
+        ],
+        route=mock_route,
+        segments=mock_segments,
+        requirements=mock_requirements,
+        critical_optimization_done=True,
+    )
+
+    asyncio.run(reviewer_node(state))
+
+    call = mock_get_llm.return_value.ainvoke.call_args
+    assert call.kwargs["system"] is REVIEWER_INITIAL_BLOCKS
+
+
+@patch("app.agent.nodes.reviewer._get_llm")
+def test_reviewer_node_responds_to_user_feedback(
+    mock_get_llm, mock_route, mock_segments, mock_requirements
+):
+    """Test that feedback on an overview is answered with the response prompt"""
+    mock_get_llm.return_value = _reviewer_llm()
+    state = AgentState(
+        messages=[
+            _tool_call_message("RouteRequirements"),
+            AIMessage(content="Overview"),
+            HumanMessage(content="Is day two hilly?"),
+        ],
+        route=mock_route,
+        segments=mock_segments,
+        requirements=mock_requirements,
+        critical_optimization_done=True,
+    )
+
+    result = asyncio.run(reviewer_node(state))
+
+    call = mock_get_llm.return_value.ainvoke.call_args
+    assert call.kwargs["system"] is REVIEWER_RESPONSE_BLOCKS
+    assert "Is day two hilly?" in call.args[0][0].content
+    assert result.update["awaiting_user_response"] is True
@@ -0,0 +1,12 @@
+from app.agent.graph.workflow import determine_entry_point
+from app.models import AgentState
+
+
+def test_determine_entry_point_follows_copied_state(mock_route, mock_requirements):
+    """Test that the entry point reflects fields changed by model_copy"""
+    state = AgentState(route=mock_route, requirements=mock_requirements)
+    assert determine_entry_point(state) == "reviewer"
+
+    confirmed = state.model_copy(update={"user_confirmed": True})
+
+    assert determine_entry_point(confirmed) == "writer"
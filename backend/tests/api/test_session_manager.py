@@ -0,0 +1,69 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.api.services.session_manager import SessionManager
+from app.models import AgentState, Route
+
+
+def _checkpoint(checkpoint_id):
+    return SimpleNamespace(config={"configurable": {"checkpoint_id": checkpoint_id}})
+
+
+@patch("app.api.services.session_manager.get_app")
+def test_get_session_state_reuses_state_until_checkpoint_changes(mock_get_app):
+    """Test that state is only re-read when a new checkpoint is saved"""
+    app = mock_get_app.return_value
+    app.checkpointer.get_tuple.return_value = _checkpoint("1")
+    app.get_state.return_value = SimpleNamespace(values={"user_confirmed": False})
+
+    manager = SessionManager()
+    session_id = manager.create_session()
+
+    first = manager.get_session_state(session_id)
+    second = manager.get_session_state(session_id)
+
+    assert second is first
+    assert app.get_state.call_count == 1
+
+    app.checkpointer.get_tuple.return_value = _checkpoint("2")
+    app.get_state.return_value = SimpleNamespace(values={"user_confirmed": True})
+
+    assert manager.get_session_state(session_id).user_confirmed is True
+    assert app.get_state.call_count == 2
+
+
+def test_from_graph_values_keeps_trusted_instances(mock_route):
+    """Test that checkpointed model instances are reused without validation"""
+    state = AgentState.from_graph_values({"route": mock_route, "messages": []})
+
+    assert state.route is mock_route
+    assert state.segments is None
+
+
+def test_from_graph_values_validates_raw_data(mock_route):
+    """Test that raw dicts are still validated into models"""
+    state = AgentState.from_graph_values({"route": mock_route.model_dump()})
+
+    assert state.route == mock_route
+
+
+@patch("app.api.services.session_manager.get_app")
+def test_get_serialized_encodes_once_per_checkpoint(mock_get_app, mock_route):
+    """Test that a field's JSON is reused until the state changes"""
+    app = mock_get_app.return_value
+    app.checkpointer.get_tuple.return_value = _checkpoint("1")
+    app.get_state.return_value = SimpleNamespace(values={"route": mock_route})
+
+    manager = SessionManager()
+    session_id = manager.create_session()
+
+    body = manager.get_serialized(session_id, "route")
+
+    assert manager.get_serialized(session_id, "route") is body
+    assert Route.model_validate_json(body) == mock_route
+    assert manager.get_serialized(session_id, "segments") == b"null"
+
+    app.checkpointer.get_tuple.return_value = _checkpoint("2")
+    app.get_state.return_value = SimpleNamespace(values={"route": None})
+
+    assert manager.get_serialized(session_id, "route") == b"null"
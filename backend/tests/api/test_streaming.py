@@ -0,0 +1,20 @@
+import json
+
+from app.api.services.streaming import _message_event
+
+
+def test_message_event_is_single_sse_data_line():
+    """Test that message events are one data line holding the JSON event"""
+    line = _message_event('Day 1: "Leeds"\nto York', '"session-1"')
+
+    assert line.startswith("data: ")
+    assert line.endswith("\n\n")
+    assert "\n" not in line[:-2]
+    assert json.loads(line[len("data: ") :]) == {
+        "event": "message",
+        "data": {
+            "content": 'Day 1: "Leeds"\nto York',
+            "type": "ai",
+            "session_id": "session-1",
+        },
+    }
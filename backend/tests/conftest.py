@@ -1,7 +1,7 @@
 import pytest
 from pydantic_extra_types.coordinate import Coordinate
 
-from app.models import Location
+from app.models import Location, Route
 
 
 @pytest.fixture
@@ -38,3 +38,15 @@ def mock_intermediate():
     return Location(
         name="Wetherby", coordinates=Coordinate(latitude=53.9277, longitude=-1.3850)
     )
+
+
+@pytest.fixture
+def mock_route(mock_origin, mock_destination):
+    """Fixture providing a test route"""
+    return Route(
+        polyline="test_polyline_string",
+        origin=mock_origin,
+        destination=mock_destination,
+        distance=42000,
+        elevation_gain=250,
+    )
@@ -3,7 +3,7 @@ from unittest.mock import Mock
 import pytest
 from pydantic_extra_types.coordinate import Coordinate
 
-from app.models import Accommodation, Location, Route, Segment
+from app.models import Accommodation, Location, Segment
 from app.models.state import AgentState, RouteRequirements
 
 
@@ -62,18 +62,6 @@ def mock_accommodation():
     ]
 
 
-@pytest.fixture
-def mock_route(mock_origin, mock_destination):
-    """Fixture providing a test route"""
-    return Route(
-        polyline="test_polyline_string",
-        origin=mock_origin,
-        destination=mock_destination,
-        distance=42000,
-        elevation_gain=250,
-    )
-
-
 @pytest.fixture
 def mock_segment(mock_route, mock_accommodation):
     """Fixture providing a test segment"""
@@ -63,6 +63,7 @@ def test_get_route_summary_with_missing_accommodation(
         day=2, route=mock_route, accommodation_options=[]
     )
     segments = [segment_with_accommodation, segment_without_accommodation]
+    mock_runtime_with_segments.state.days_without_accommodation = [2]
 
     mock_validate_route.return_value = (route, requirements)
     mock_validate_segments.return_value = segments
@@ -94,6 +95,7 @@ def test_adjust_daily_distance_success(
     assert "segments" in result.update
     assert "requirements" in result.update
     assert result.update["requirements"].daily_distance_km == 60
+    assert result.update["days_without_accommodation"] == []
     mock_recalculate.assert_called_once_with(route, 60)
 
 
@@ -130,13 +132,13 @@ def test_adjust_daily_distance_too_high(
 
 
 @patch("app.tools.route.recalculate_segments_with_accommodation")
-@patch("app.tools.route.fetch_route")
+@patch("app.tools.route.get_cached_route")
 @patch("app.tools.route.geocode_location")
 @patch("app.tools.route.validate_route_state")
 def test_add_intermediate_waypoint_success(
     mock_validate_route,
     mock_geocode,
-    mock_fetch_route,
+    mock_get_cached_route,
     mock_recalculate,
     mock_runtime_with_segments,
     mock_route,
@@ -148,7 +150,7 @@ def test_add_intermediate_waypoint_success(
 
     mock_validate_route.return_value = (route, requirements)
     mock_geocode.return_value = Coordinate(latitude=53.9277, longitude=-1.3850)
-    mock_fetch_route.return_value = mock_route
+    mock_get_cached_route.return_value = mock_route
     mock_recalculate.return_value = [mock_segment]
 
     result = add_intermediate_waypoint.func(
@@ -165,13 +167,13 @@ def test_add_intermediate_waypoint_success(
 
 
 @patch("app.tools.route.recalculate_segments_with_accommodation")
-@patch("app.tools.route.fetch_route")
+@patch("app.tools.route.get_cached_route")
 @patch("app.tools.route.geocode_location")
 @patch("app.tools.route.validate_route_state")
 def test_add_intermediate_waypoint_at_position(
     mock_validate_route,
     mock_geocode,
-    mock_fetch_route,
+    mock_get_cached_route,
     mock_recalculate,
     mock_runtime_with_segments,
     mock_route,
@@ -183,7 +185,7 @@ def test_add_intermediate_waypoint_at_position(
 
     mock_validate_route.return_value = (route, requirements)
     mock_geocode.return_value = Coordinate(latitude=53.9277, longitude=-1.3850)
-    mock_fetch_route.return_value = mock_route
+    mock_get_cached_route.return_value = mock_route
     mock_recalculate.return_value = [mock_segment]
 
     result = add_intermediate_waypoint.func(
@@ -237,11 +239,11 @@ def test_add_intermediate_waypoint_invalid_position(
 
 
 @patch("app.tools.route.recalculate_segments_with_accommodation")
-@patch("app.tools.route.fetch_route")
+@patch("app.tools.route.get_cached_route")
 @patch("app.tools.route.validate_route_state")
 def test_remove_intermediate_waypoint_success(
     mock_validate_route,
-    mock_fetch_route,
+    mock_get_cached_route,
     mock_recalculate,
     mock_runtime_with_segments,
     mock_route,
@@ -254,7 +256,7 @@ def test_remove_intermediate_waypoint_success(
     requirements.intermediates = [mock_intermediate]
 
     mock_validate_route.return_value = (route, requirements)
-    mock_fetch_route.return_value = mock_route
+    mock_get_cached_route.return_value = mock_route
     mock_recalculate.return_value = [mock_segment]
 
     result = remove_intermediate_waypoint.func(
@@ -307,13 +309,13 @@ def test_remove_intermediate_waypoint_invalid_index(
 
 
 @patch("app.tools.route.recalculate_segments_with_accommodation")
-@patch("app.tools.route.fetch_route")
+@patch("app.tools.route.get_cached_route")
 @patch("app.tools.route.geocode_location")
 @patch("app.tools.route.validate_route_state")
 def test_recalculate_complete_route_new_origin(
     mock_validate_route,
     mock_geocode,
-    mock_fetch_route,
+    mock_get_cached_route,
     mock_recalculate,
     mock_runtime_with_segments,
     mock_route,
@@ -325,7 +327,7 @@ def test_recalculate_complete_route_new_origin(
 
     mock_validate_route.return_value = (route, requirements)
     mock_geocode.return_value = Coordinate(latitude=51.5074, longitude=-0.1278)
-    mock_fetch_route.return_value = mock_route
+    mock_get_cached_route.return_value = mock_route
     mock_recalculate.return_value = [mock_segment]
 
     result = recalculate_complete_route.func(
@@ -341,13 +343,13 @@ def test_recalculate_complete_route_new_origin(
 
 
 @patch("app.tools.route.recalculate_segments_with_accommodation")
-@patch("app.tools.route.fetch_route")
+@patch("app.tools.route.get_cached_route")
 @patch("app.tools.route.geocode_location")
 @patch("app.tools.route.validate_route_state")
 def test_recalculate_complete_route_new_destination(
     mock_validate_route,
     mock_geocode,
-    mock_fetch_route,
+    mock_get_cached_route,
     mock_recalculate,
     mock_runtime_with_segments,
     mock_route,
@@ -359,7 +361,7 @@ def test_recalculate_complete_route_new_destination(
 
     mock_validate_route.return_value = (route, requirements)
     mock_geocode.return_value = Coordinate(latitude=51.5074, longitude=-0.1278)
-    mock_fetch_route.return_value = mock_route
+    mock_get_cached_route.return_value = mock_route
     mock_recalculate.return_value = [mock_segment]
 
     result = recalculate_complete_route.func(
@@ -371,13 +373,13 @@ def test_recalculate_complete_route_new_destination(
 
 
 @patch("app.tools.route.recalculate_segments_with_accommodation")
-@patch("app.tools.route.fetch_route")
+@patch("app.tools.route.get_cached_route")
 @patch("app.tools.route.convert_place_names_to_locations")
 @patch("app.tools.route.validate_route_state")
 def test_recalculate_complete_route_with_intermediates(
     mock_validate_route,
     mock_convert_places,
-    mock_fetch_route,
+    mock_get_cached_route,
     mock_recalculate,
     mock_runtime_with_segments,
     mock_route,
@@ -390,7 +392,7 @@ def test_recalculate_complete_route_with_intermediates(
 
     mock_validate_route.return_value = (route, requirements)
     mock_convert_places.return_value = [mock_intermediate]
-    mock_fetch_route.return_value = mock_route
+    mock_get_cached_route.return_value = mock_route
     mock_recalculate.return_value = [mock_segment]
 
     result = recalculate_complete_route.func(
@@ -422,17 +424,17 @@ def test_recalculate_complete_route_geocoding_error(
     assert "Failed to geocode new origin" in str(exc_info.value)
 
 
-@patch("app.tools.route.fetch_route")
+@patch("app.tools.route.get_cached_route")
 @patch("app.tools.route.validate_route_state")
 def test_recalculate_complete_route_fetch_error(
-    mock_validate_route, mock_fetch_route, mock_runtime_with_segments
+    mock_validate_route, mock_get_cached_route, mock_runtime_with_segments
 ):
     """Test error handling when route fetch fails"""
     route = mock_runtime_with_segments.state.route
     requirements = mock_runtime_with_segments.state.requirements
 
     mock_validate_route.return_value = (route, requirements)
-    mock_fetch_route.side_effect = Exception("Route calculation failed")
+    mock_get_cached_route.side_effect = Exception("Route calculation failed")
 
     with pytest.raises(ValueError) as exc_info:
         recalculate_complete_route.func(runtime=mock_runtime_with_segments)
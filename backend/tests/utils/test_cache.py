@@ -0,0 +1,143 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from pydantic_extra_types.coordinate import Coordinate
+
+from app.models import Accommodation, Location, Route, Segment
+from app.utils.cache import (TTLCache, accommodation_cache,
+                             get_cached_accommodation, get_cached_route,
+                             get_cached_segments, route_cache, segments_cache)
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_caches():
+    """Start every test with empty shared lookup caches"""
+    for cache in (accommodation_cache, route_cache, segments_cache):
+        cache.clear()
+    yield
+    for cache in (accommodation_cache, route_cache, segments_cache):
+        cache.clear()
+
+
+def test_ttl_cache_counts_hits_and_misses():
+    """Test that a repeated key is served without calling the factory"""
+    cache = TTLCache("test", maxsize=4, ttl=60)
+    factory = Mock(return_value="value")
+
+    assert cache.get_or_set("key", factory) == "value"
+    assert cache.get_or_set("key", factory) == "value"
+
+    factory.assert_called_once()
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+@patch("app.utils.cache.time.monotonic")
+def test_ttl_cache_refetches_expired_entries(mock_monotonic):
+    """Test that entries older than the TTL are fetched again"""
+    cache = TTLCache("test", maxsize=4, ttl=60)
+    factory = Mock(side_effect=["old", "new"])
+
+    mock_monotonic.return_value = 0
+    assert cache.get_or_set("key", factory) == "old"
+
+    mock_monotonic.return_value = 61
+    assert cache.get_or_set("key", factory) == "new"
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test that the oldest unused entry is dropped when full"""
+    cache = TTLCache("test", maxsize=2, ttl=60)
+    cache.get_or_set("a", lambda: 1)
+    cache.get_or_set("b", lambda: 2)
+    cache.get_or_set("a", lambda: 1)
+    cache.get_or_set("c", lambda: 3)
+
+    factory = Mock(return_value=2)
+    cache.get_or_set("b", factory)
+    factory.assert_called_once()
+
+
+def test_ttl_cache_does_not_store_failures():
+    """Test that an exception from the factory leaves the key uncached"""
+    cache = TTLCache("test", maxsize=4, ttl=60)
+
+    with pytest.raises(ValueError):
+        cache.get_or_set("key", Mock(side_effect=ValueError("boom")))
+
+    assert cache.get_or_set("key", lambda: "value") == "value"
+
+
+@patch("app.utils.cache.get_accommodation")
+def test_get_cached_accommodation_shares_nearby_lookups(mock_get_accommodation):
+    """Test that points within the rounding precision share one request"""
+    mock_get_accommodation.return_value = [
+        Accommodation(
+            name="Test Hotel",
+            address="123 Test St, Leeds",
+            map_link="https://maps.google.com/place/test",
+            rating=4.5,
+        )
+    ]
+
+    first = get_cached_accommodation(Coordinate(latitude=53.80081, longitude=-1.54911))
+    second = get_cached_accommodation(Coordinate(latitude=53.80079, longitude=-1.54909))
+
+    mock_get_accommodation.assert_called_once()
+    assert first == second
+    assert first is not second
+
+
+@patch("app.utils.cache.fetch_route")
+def test_get_cached_route_reuses_route_with_caller_locations(
+    mock_fetch_route, mock_origin, mock_destination
+):
+    """Test that a renamed but co-located stop reuses the cached route"""
+    mock_fetch_route.return_value = Route(
+        polyline="test_polyline",
+        origin=mock_origin,
+        destination=mock_destination,
+        distance=40000,
+        elevation_gain=200,
+    )
+    renamed_origin = Location(name="Leeds Station", coordinates=mock_origin.coordinates)
+
+    get_cached_route(mock_origin, mock_destination)
+    result = get_cached_route(renamed_origin, mock_destination)
+
+    mock_fetch_route.assert_called_once()
+    assert result.polyline == "test_polyline"
+    assert result.origin == renamed_origin
+
+
+@patch("app.utils.cache.calculate_segments")
+def test_get_cached_segments_returns_independent_copies(
+    mock_calculate_segments, mock_origin, mock_destination
+):
+    """Test that mutating returned segments does not affect the cache"""
+    mock_calculate_segments.return_value = [
+        Segment(
+            day=1,
+            route=Route(
+                polyline="day_one",
+                origin=mock_origin,
+                destination=mock_destination,
+                distance=40000,
+                elevation_gain=200,
+            ),
+        )
+    ]
+
+    first = get_cached_segments("test_polyline", 50000, mock_origin, mock_destination)
+    first[0].accommodation_options.append(
+        Accommodation(
+            name="Test Hotel",
+            address="123 Test St, York",
+            map_link="https://maps.google.com/place/test",
+            rating=4.5,
+        )
+    )
+    second = get_cached_segments("test_polyline", 50000, mock_origin, mock_destination)
+
+    mock_calculate_segments.assert_called_once()
+    assert second[0].accommodation_options == []
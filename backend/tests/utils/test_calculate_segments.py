@@ -1,13 +1,16 @@
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
+import numpy as np
+import polyline
 import pytest
 
-from app.utils.utils import calculate_segments
+from app.utils.utils import (calculate_segments, decode_polyline,
+                             edge_distances_km)
 
 
 @patch("app.utils.utils.get_elevation_gain")
 @patch("app.utils.utils.reverse_geocode")
-@patch("app.utils.utils.polyline.decode")
+@patch("app.utils.utils.decode_polyline")
 def test_calculate_segments_single_day(
     mock_decode,
     mock_geocode,
@@ -33,10 +36,10 @@ def test_calculate_segments_single_day(
 
 @patch("app.utils.utils.get_elevation_gain")
 @patch("app.utils.utils.reverse_geocode")
-@patch("app.utils.utils.polyline.decode")
-@patch("app.utils.utils.geodesic")
+@patch("app.utils.utils.decode_polyline")
+@patch("app.utils.utils.edge_distances_km")
 def test_calculate_segments_multiple_days(
-    mock_geodesic,
+    mock_edge_distances,
     mock_decode,
     mock_geocode,
     mock_elevation,
@@ -53,11 +56,9 @@ def test_calculate_segments_multiple_days(
         (53.9508, -1.2491),
         (53.9599, -1.0873),
     ]
-    # Mock geodesic to return predictable distances that will create multiple segments
+    # Mock edge distances that will create multiple segments
     # Each edge is 15km so with 10km daily distance we get multiple segments
-    mock_distance = Mock()
-    mock_distance.kilometers = 15.0
-    mock_geodesic.return_value = mock_distance
+    mock_edge_distances.return_value = np.full(4, 15.0)
 
     # Provide enough return values for all possible reverse_geocode calls
     mock_geocode.return_value = "Intermediate Point"
@@ -85,7 +86,7 @@ def test_calculate_segments_multiple_days(
 
 @patch("app.utils.utils.get_elevation_gain")
 @patch("app.utils.utils.reverse_geocode")
-@patch("app.utils.utils.polyline.decode")
+@patch("app.utils.utils.decode_polyline")
 def test_calculate_segments_origin_destination_linking(
     mock_decode,
     mock_geocode,
@@ -121,7 +122,7 @@ def test_calculate_segments_origin_destination_linking(
 
 @patch("app.utils.utils.get_elevation_gain")
 @patch("app.utils.utils.reverse_geocode")
-@patch("app.utils.utils.polyline.decode")
+@patch("app.utils.utils.decode_polyline")
 def test_calculate_segments_calls_reverse_geocode_for_intermediates(
     mock_decode,
     mock_geocode,
@@ -148,7 +149,7 @@ def test_calculate_segments_calls_reverse_geocode_for_intermediates(
 
 @patch("app.utils.utils.get_elevation_gain")
 @patch("app.utils.utils.reverse_geocode")
-@patch("app.utils.utils.polyline.decode")
+@patch("app.utils.utils.decode_polyline")
 def test_calculate_segments_accommodation_options_empty(
     mock_decode,
     mock_geocode,
@@ -168,7 +169,7 @@ def test_calculate_segments_accommodation_options_empty(
         assert segment.accommodation_options == []
 
 
-@patch("app.utils.utils.polyline.decode")
+@patch("app.utils.utils.decode_polyline")
 def test_calculate_segments_invalid_polyline_empty(
     mock_decode, mock_origin, mock_destination
 ):
@@ -181,7 +182,7 @@ def test_calculate_segments_invalid_polyline_empty(
     assert "Invalid polyline" in str(exc_info.value)
 
 
-@patch("app.utils.utils.polyline.decode")
+@patch("app.utils.utils.decode_polyline")
 def test_calculate_segments_invalid_polyline_single_point(
     mock_decode, mock_origin, mock_destination
 ):
@@ -196,7 +197,7 @@ def test_calculate_segments_invalid_polyline_single_point(
 
 @patch("app.utils.utils.get_elevation_gain")
 @patch("app.utils.utils.reverse_geocode")
-@patch("app.utils.utils.polyline.decode")
+@patch("app.utils.utils.decode_polyline")
 def test_calculate_segments_distance_conversion(
     mock_decode,
     mock_geocode,
@@ -223,7 +224,7 @@ def test_calculate_segments_distance_conversion(
 
 @patch("app.utils.utils.get_elevation_gain")
 @patch("app.utils.utils.reverse_geocode")
-@patch("app.utils.utils.polyline.decode")
+@patch("app.utils.utils.decode_polyline")
 @patch("app.utils.utils.polyline.encode")
 def test_calculate_segments_encodes_segment_polylines(
     mock_encode,
@@ -250,3 +251,68 @@ def test_calculate_segments_encodes_segment_polylines(
     assert mock_encode.call_count == len(result)
     for segment in result:
         assert segment.route.polyline in ["segment1_polyline", "segment2_polyline"]
+
+
+def test_decode_polyline_matches_reference_decoder(simple_polyline):
+    """Test that the vectorised decoder agrees with polyline.decode"""
+    result = decode_polyline(simple_polyline)
+
+    assert result.tolist() == [
+        list(point) for point in polyline.decode(simple_polyline)
+    ]
+
+
+def test_decode_polyline_rejects_incomplete_pair():
+    """Test that a polyline ending mid-coordinate is rejected"""
+    with pytest.raises(ValueError) as exc_info:
+        decode_polyline("_p~iF")
+
+    assert "Invalid polyline" in str(exc_info.value)
+
+
+def test_edge_distances_km_matches_known_distance():
+    """Test that edge lengths match the Leeds to York distance"""
+    result = edge_distances_km([(53.8008, -1.5491), (53.9599, -1.0873)])
+
+    assert result.shape == (1,)
+    assert result[0] == pytest.approx(35.16, rel=0.005)
+
+
+def test_edge_distances_km_wraps_antimeridian():
+    """Test that an edge crossing 180 degrees longitude is measured the short way"""
+    result = edge_distances_km([(0.0, 179.9), (0.0, -179.9)])
+
+    assert result[0] == pytest.approx(22.26, rel=0.005)
+
+
+@patch("app.utils.utils.get_elevation_gain")
+@patch("app.utils.utils.reverse_geocode")
+@patch("app.utils.utils.decode_polyline")
+@patch("app.utils.utils.edge_distances_km")
+def test_calculate_segments_splits_on_cumulative_distance(
+    mock_edge_distances,
+    mock_decode,
+    mock_geocode,
+    mock_elevation,
+    mock_origin,
+    mock_destination,
+    simple_polyline,
+):
+    """Test that each day ends on the first edge reaching its target"""
+    mock_decode.return_value = [
+        (53.8008, -1.5491),
+        (53.8508, -1.4491),
+        (53.9008, -1.3491),
+        (53.9508, -1.2491),
+        (53.9599, -1.0873),
+    ]
+    mock_edge_distances.return_value = np.array([4.0, 4.0, 4.0, 4.0])
+    mock_geocode.return_value = "Intermediate Point"
+    mock_elevation.return_value = 100
+
+    result = calculate_segments(simple_polyline, 7000, mock_origin, mock_destination)
+
+    assert [seg.route.distance for seg in result] == [8000, 8000]
+    assert result[0].route.destination.name == "Intermediate Point"
+    assert result[1].route.destination == mock_destination
+    mock_geocode.assert_called_once()
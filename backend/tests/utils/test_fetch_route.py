@@ -8,7 +8,7 @@ from app.utils.utils import fetch_route
 
 
 @patch("app.utils.utils.get_elevation_gain")
-@patch("app.utils.utils.requests.post")
+@patch("app.utils.utils.http_session.post")
 @patch("app.utils.utils.settings")
 def test_fetch_route_success_bicycle(
     mock_settings, mock_post, mock_elevation, mock_origin, mock_destination
@@ -48,7 +48,7 @@ def test_fetch_route_success_bicycle(
 
 
 @patch("app.utils.utils.get_elevation_gain")
-@patch("app.utils.utils.requests.post")
+@patch("app.utils.utils.http_session.post")
 @patch("app.utils.utils.settings")
 def test_fetch_route_with_intermediates(
     mock_settings,
@@ -92,7 +92,7 @@ def test_fetch_route_with_intermediates(
 
 
 @patch("app.utils.utils.get_elevation_gain")
-@patch("app.utils.utils.requests.post")
+@patch("app.utils.utils.http_session.post")
 @patch("app.utils.utils.settings")
 def test_fetch_route_fallback_to_drive(
     mock_settings, mock_post, mock_elevation, mock_origin, mock_destination
@@ -137,7 +137,7 @@ def test_fetch_route_fallback_to_drive(
     assert second_call_body["routingPreference"] == "TRAFFIC_UNAWARE"
 
 
-@patch("app.utils.utils.requests.post")
+@patch("app.utils.utils.http_session.post")
 @patch("app.utils.utils.settings")
 def test_fetch_route_all_strategies_fail(
     mock_settings, mock_post, mock_origin, mock_destination
@@ -158,7 +158,7 @@ def test_fetch_route_all_strategies_fail(
         fetch_route(mock_origin, mock_destination)
 
 
-@patch("app.utils.utils.requests.post")
+@patch("app.utils.utils.http_session.post")
 @patch("app.utils.utils.settings")
 def test_fetch_route_request_exception(
     mock_settings, mock_post, mock_origin, mock_destination
@@ -6,7 +6,7 @@ import requests
 from app.utils.utils import get_accommodation
 
 
-@patch("app.utils.utils.requests.post")
+@patch("app.utils.utils.http_session.post")
 @patch("app.utils.utils.settings")
 def test_get_accommodation_success(mock_settings, mock_post, mock_coordinate):
     """Test successful accommodation search"""
@@ -45,7 +45,7 @@ def test_get_accommodation_success(mock_settings, mock_post, mock_coordinate):
     assert result[1].name == "Another Hotel"
 
 
-@patch("app.utils.utils.requests.post")
+@patch("app.utils.utils.http_session.post")
 @patch("app.utils.utils.settings")
 def test_get_accommodation_with_custom_radius(
     mock_settings, mock_post, mock_coordinate
@@ -67,7 +67,7 @@ def test_get_accommodation_with_custom_radius(
     assert request_body["locationRestriction"]["circle"]["radius"] == 10000
 
 
-@patch("app.utils.utils.requests.post")
+@patch("app.utils.utils.http_session.post")
 @patch("app.utils.utils.settings")
 def test_get_accommodation_empty_results(mock_settings, mock_post, mock_coordinate):
     """Test handling of empty results"""
@@ -87,7 +87,7 @@ def test_get_accommodation_empty_results(mock_settings, mock_post, mock_coordina
     assert result == []
 
 
-@patch("app.utils.utils.requests.post")
+@patch("app.utils.utils.http_session.post")
 @patch("app.utils.utils.settings")
 def test_get_accommodation_all_fields_present(
     mock_settings, mock_post, mock_coordinate
@@ -122,7 +122,7 @@ def test_get_accommodation_all_fields_present(
     assert result[0].rating == 4.8
 
 
-@patch("app.utils.utils.requests.post")
+@patch("app.utils.utils.http_session.post")
 @patch("app.utils.utils.settings")
 def test_get_accommodation_request_exception(mock_settings, mock_post, mock_coordinate):
     """Test handling of request exceptions"""
@@ -140,7 +140,7 @@ def test_get_accommodation_request_exception(mock_settings, mock_post, mock_coor
     assert "Error making request to Google Places API" in str(exc_info.value)
 
 
-@patch("app.utils.utils.requests.post")
+@patch("app.utils.utils.http_session.post")
 @patch("app.utils.utils.settings")
 def test_get_accommodation_generic_error(mock_settings, mock_post, mock_coordinate):
     """Test handling of base errors"""
@@ -0,0 +1,18 @@
+from app.utils.http import MAX_RETRIES, POOL_MAXSIZE, create_http_session
+
+
+def test_create_http_session_mounts_pooled_adapter():
+    """Test that HTTPS requests share a pooled adapter with retries"""
+    session = create_http_session()
+
+    adapter = session.get_adapter("https://routes.googleapis.com")
+
+    assert adapter._pool_maxsize == POOL_MAXSIZE
+    assert adapter.max_retries is MAX_RETRIES
+
+
+def test_retries_only_resend_idempotent_requests_on_error_status():
+    """Test that billable POSTs are not retried on an error response"""
+    assert MAX_RETRIES.is_retry("GET", 503)
+    assert not MAX_RETRIES.is_retry("POST", 503)
+    assert not MAX_RETRIES.is_retry("POST", 429)
@@ -7,7 +7,7 @@ import requests
 from app.utils.utils import reverse_geocode
 
 
-@patch("app.utils.utils.requests.get")
+@patch("app.utils.utils.http_session.get")
 @patch("app.utils.utils.settings")
 def test_reverse_geocode_success_with_locality(
     mock_settings, mock_get, mock_coordinate
@@ -45,7 +45,7 @@ def test_reverse_geocode_success_with_locality(
     assert call_params["key"] == "test_api_key"
 
 
-@patch("app.utils.utils.requests.get")
+@patch("app.utils.utils.http_session.get")
 @patch("app.utils.utils.settings")
 def test_reverse_geocode_success_with_postal_town(
     mock_settings, mock_get, mock_coordinate
@@ -79,7 +79,7 @@ def test_reverse_geocode_success_with_postal_town(
     assert result == "York, UK"
 
 
-@patch("app.utils.utils.requests.get")
+@patch("app.utils.utils.http_session.get")
 @patch("app.utils.utils.settings")
 def test_reverse_geocode_fallback_to_admin_area_2(
     mock_settings, mock_get, mock_coordinate
@@ -112,7 +112,7 @@ def test_reverse_geocode_fallback_to_admin_area_2(
     assert result == "West Yorkshire, UK"
 
 
-@patch("app.utils.utils.requests.get")
+@patch("app.utils.utils.http_session.get")
 @patch("app.utils.utils.settings")
 def test_reverse_geocode_fallback_to_admin_area_1(
     mock_settings, mock_get, mock_coordinate
@@ -141,7 +141,7 @@ def test_reverse_geocode_fallback_to_admin_area_1(
     assert result == "England, UK"
 
 
-@patch("app.utils.utils.requests.get")
+@patch("app.utils.utils.http_session.get")
 @patch("app.utils.utils.settings")
 def test_reverse_geocode_fallback_to_first_result(
     mock_settings, mock_get, mock_coordinate
@@ -165,7 +165,7 @@ def test_reverse_geocode_fallback_to_first_result(
     assert result == "A61, Leeds, UK"
 
 
-@patch("app.utils.utils.requests.get")
+@patch("app.utils.utils.http_session.get")
 @patch("app.utils.utils.settings")
 def test_reverse_geocode_handles_non_ok_status(
     mock_settings, mock_get, mock_coordinate
@@ -186,7 +186,7 @@ def test_reverse_geocode_handles_non_ok_status(
     assert result == "Location at 53.8008,-1.5491"
 
 
-@patch("app.utils.utils.requests.get")
+@patch("app.utils.utils.http_session.get")
 @patch("app.utils.utils.settings")
 def test_reverse_geocode_handles_empty_results(
     mock_settings, mock_get, mock_coordinate
@@ -207,7 +207,7 @@ def test_reverse_geocode_handles_empty_results(
     assert result == "Location at 53.8008,-1.5491"
 
 
-@patch("app.utils.utils.requests.get")
+@patch("app.utils.utils.http_session.get")
 @patch("app.utils.utils.settings")
 def test_reverse_geocode_handles_request_exception(
     mock_settings, mock_get, mock_coordinate
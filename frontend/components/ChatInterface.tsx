@@ -195,7 +195,6 @@ export function ChatInterface({ toggleSidebar }: ChatInterfaceProps) {
                 textQueue += eventData.content;
                 displayQueuedText();
               }
-              break;
             } catch (parseError) {
               console.error("Error parsing SSE data:", parseError);
               console.error("Problematic data:", dataStr);